@@ -0,0 +1,329 @@
+import os
+import io
+import re
+import sys
+import json
+import time
+import random
+import shutil
+import hashlib
+import argparse
+import platform
+import tempfile
+import threading
+import statistics
+import subprocess
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# === Repository root (the folder containing the launcher package) ===
+repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# === Scenarios, in the order they run in every repetition ===
+SCENARIOS = ["cold_install", "warm_noop", "verify", "repair_one_corrupt"]
+
+# === Runs the launcher in a fresh interpreter with the asset URLs pointed at the local server ===
+RUNNER = """import sys
+import launcher.assets
+launcher.assets.ASSETS_ZIP_URL = sys.argv[1]
+launcher.assets.RESOURCES_URL = sys.argv[2]
+from launcher.cli import main
+sys.exit(main(sys.argv[4:], main_dir=sys.argv[3]))
+"""
+
+# === Command line options ===
+parser = argparse.ArgumentParser(description="Offline benchmark for the a1.1.1 installer")
+parser.add_argument("--repeat", type=int, default=3, help="number of times every scenario is run (default: 3)")
+parser.add_argument("--jobs", type=int, default=8, help="parallel downloads passed to the installer (default: 8)")
+parser.add_argument("--assets", choices=["archive", "index"], default="archive", help="asset mode passed to the installer (default: archive)")
+parser.add_argument("--assets-mb", type=float, default=8, help="size of the synthetic resources.zip in MB (default: 8)")
+parser.add_argument("--latency", type=float, default=0, help="delay before every response in milliseconds (default: 0)")
+parser.add_argument("--bandwidth", type=float, default=0, help="per-connection bandwidth in KB/s, 0 for unlimited (default: 0)")
+parser.add_argument("--failure-rate", type=float, default=0, help="fraction of requests that fail (default: 0)")
+parser.add_argument("--failure-mode", choices=["error", "drop"], default="error",
+                    help="failed requests answer 503 (error) or cut the body in half (drop) (default: error)")
+parser.add_argument("--seed", type=int, default=1, help="seed for the synthetic artifacts and failure injection (default: 1)")
+parser.add_argument("--output", help="where to write the JSON results (default: benchmarks/results/<version>.json)")
+parser.add_argument("--compare", help="earlier results file to compare the medians against")
+parser.add_argument("--threshold", type=float, default=10, help="slowdown in percent reported as a regression (default: 10)")
+parser.add_argument("--keep", action="store_true", help="keep the temporary workspace")
+
+# === Function to build a zip in memory ===
+def make_zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_ref:
+        for name, data in members.items():
+            zip_ref.writestr(name, data)
+    return buffer.getvalue()
+
+# === Function to build a jar of incompressible classes close to the size listed in a1.1.1.json ===
+def make_jar(path, size, rng):
+    package = path.rsplit("/", 1)[-1].replace(".jar", "").replace("-", "_").replace(".", "_")
+    members = {"META-INF/MANIFEST.MF": b"Manifest-Version: 1.0\r\n\r\n", "META-INF/BENCH.SF": b"Signature-Version: 1.0\r\n"}
+    for index in range(max(1, size // 8192)):
+        members[f"{package}/Class{index}.class"] = rng.randbytes(min(8192, size))
+    return make_zip(members)
+
+# === Function to build a natives jar for one classifier ===
+def make_natives(path, size, rng):
+    name = path.rsplit("/", 1)[-1].split("-")[0]
+    extension = ".dll" if "natives-windows" in path else ".dylib" if "natives-osx" in path else ".so"
+    prefix = "" if extension == ".dll" else "lib"
+    return make_zip({
+        "META-INF/MANIFEST.MF": b"Manifest-Version: 1.0\r\n\r\n",
+        f"{prefix}{name}{extension}": rng.randbytes(max(1, size // 2)),
+        f"{prefix}{name}64{extension}": rng.randbytes(max(1, size // 2)),
+    })
+
+# === Function to write the synthetic artifacts and a1.1.1.json pointing at the local server ===
+def build_artifacts(server_dir, game_dir, base_url, assets_mb, rng):
+    with open(os.path.join(repo_dir, "a1.1.1.json"), "r") as f:
+        version_data = json.load(f)
+
+    def publish(relative_path, body):
+        target_path = os.path.join(server_dir, *relative_path.split("/"))
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        with open(target_path, "wb") as f:
+            f.write(body)
+        return {"url": f"{base_url}/{relative_path}", "sha1": hashlib.sha1(body).hexdigest(), "size": len(body)}
+
+    # Libraries and natives keep their paths and approximate sizes
+    for lib in version_data["libraries"]:
+        downloads = lib.get("downloads", {})
+        if "artifact" in downloads:
+            artifact = downloads["artifact"]
+            artifact.update(publish(f"libraries/{artifact['path']}", make_jar(artifact["path"], artifact["size"], rng)))
+        for classifier in downloads.get("classifiers", {}).values():
+            classifier.update(publish(f"libraries/{classifier['path']}", make_natives(classifier["path"], classifier["size"], rng)))
+
+    # resources.zip, plus the same files as an asset index and object store
+    members = {}
+    file_size = 256 * 1024
+    for index in range(max(1, int(assets_mb * 1024 * 1024) // file_size)):
+        members[f"sound/bench/sound{index}.ogg"] = rng.randbytes(file_size)
+    archive = publish("archive/resources.zip", make_zip(members))
+
+    objects = {}
+    for name, data in members.items():
+        object_hash = hashlib.sha1(data).hexdigest()
+        publish(f"objects/{object_hash[:2]}/{object_hash}", data)
+        objects[name] = {"hash": object_hash, "size": len(data)}
+    version_data["assetIndex"].update(publish("indexes/legacy.json", json.dumps({"objects": objects}).encode()))
+
+    with open(os.path.join(game_dir, "a1.1.1.json"), "w") as f:
+        json.dump(version_data, f, indent=2)
+    return version_data, archive["url"], f"{base_url}/objects"
+
+# === Local HTTP stand-in with latency, bandwidth and failure injection ===
+class BenchHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_dir = None
+    latency = 0.0
+    bandwidth = 0.0
+    failure_rate = 0.0
+    failure_mode = "error"
+    rng = None
+    lock = threading.Lock()
+    stats = {"requests": 0, "bytes": 0, "failures": 0}
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_empty(self, status):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        with self.lock:
+            self.stats["requests"] += 1
+            failing = self.rng.random() < self.failure_rate
+            if failing:
+                self.stats["failures"] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        file_path = os.path.join(self.server_dir, *self.path.split("?")[0].lstrip("/").split("/"))
+        if not os.path.isfile(file_path):
+            self.send_empty(404)
+            return
+        if failing and self.failure_mode == "error":
+            self.send_empty(503)
+            return
+
+        with open(file_path, "rb") as f:
+            body = f.read()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        match = re.match(r"bytes=(\d+)-$", self.headers.get("Range", ""))
+        if match and self.headers.get("If-Range", etag) == etag and int(match.group(1)) < len(body):
+            start = int(match.group(1))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+            body = body[start:]
+        else:
+            self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        # A dropped response stops half way and closes the connection
+        end = len(body) // 2 if failing else len(body)
+        for offset in range(0, end, 16384):
+            chunk = body[offset:min(offset + 16384, end)]
+            try:
+                self.wfile.write(chunk)
+            except OSError:
+                return
+            with self.lock:
+                self.stats["bytes"] += len(chunk)
+            if self.bandwidth:
+                time.sleep(len(chunk) / self.bandwidth)
+        if failing:
+            self.close_connection = True
+
+# === Function to run the launcher once and time it ===
+def run_launcher(game_dir, archive_url, resources_url, argv, log_path):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = repo_dir + os.pathsep + env.get("PYTHONPATH", "")
+    # The shared caches live in the workspace, so a cold install starts without them
+    env["XDG_CACHE_HOME"] = env["LOCALAPPDATA"] = os.path.join(os.path.dirname(game_dir), "cache")
+    start = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        exit_code = subprocess.call([sys.executable, "-c", RUNNER, archive_url, resources_url, game_dir] + argv,
+                                    stdout=log, stderr=subprocess.STDOUT, env=env)
+    return time.perf_counter() - start, exit_code
+
+# === Function to flip one byte in the middle of a file ===
+def corrupt_file(file_path):
+    with open(file_path, "r+b") as f:
+        f.seek(os.path.getsize(file_path) // 2)
+        byte = f.read(1)
+        f.seek(-1, os.SEEK_CUR)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+# === Function to describe the code being measured ===
+def version_label():
+    try:
+        return subprocess.check_output(["git", "describe", "--always", "--dirty"], cwd=repo_dir,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+# === Function to print the change against an earlier results file ===
+def compare_results(results, previous_path, threshold):
+    with open(previous_path, "r") as f:
+        previous = json.load(f)
+
+    print(f"\n📊 Compared with {previous_path} ({previous.get('version', 'unknown')}):")
+    regressions = 0
+    for name in SCENARIOS:
+        if name not in results["scenarios"] or name not in previous.get("scenarios", {}):
+            continue
+        old = previous["scenarios"][name]["median"]
+        new = results["scenarios"][name]["median"]
+        change = (new - old) / old * 100 if old else 0.0
+        marker = "⚠️" if change > threshold else "✅"
+        regressions += change > threshold
+        print(f"   {marker} {name:<20} {old:8.3f}s -> {new:8.3f}s ({change:+.1f}%)")
+    return regressions
+
+# === Benchmark ===
+def main():
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    workspace = tempfile.mkdtemp(prefix="a1.1.1-bench-")
+    server_dir = os.path.join(workspace, "server")
+    game_dir = os.path.join(workspace, "game")
+    log_dir = os.path.join(workspace, "logs")
+    for folder in (server_dir, game_dir, log_dir):
+        os.makedirs(folder)
+
+    BenchHandler.server_dir = server_dir
+    BenchHandler.latency = args.latency / 1000
+    BenchHandler.bandwidth = args.bandwidth * 1024
+    BenchHandler.failure_rate = args.failure_rate
+    BenchHandler.failure_mode = args.failure_mode
+    BenchHandler.rng = random.Random(args.seed)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BenchHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"📦 Building synthetic artifacts in {workspace}...")
+    version_data, archive_url, resources_url = build_artifacts(server_dir, game_dir, base_url, args.assets_mb, rng)
+    first_library = next(lib["downloads"]["artifact"]["path"] for lib in version_data["libraries"]
+                         if "artifact" in lib.get("downloads", {}))
+    options = ["--jobs", str(args.jobs), "--assets", args.assets]
+    commands = {
+        "cold_install": ["install"] + options,
+        "warm_noop": ["install"] + options,
+        "verify": ["verify", "--assets", args.assets],
+        "repair_one_corrupt": ["repair"] + options,
+    }
+
+    runs = {name: [] for name in SCENARIOS}
+    for repetition in range(args.repeat):
+        for name in SCENARIOS:
+            if name == "cold_install":
+                shutil.rmtree(os.path.join(game_dir, "minecraft"), ignore_errors=True)
+                shutil.rmtree(os.path.join(workspace, "cache"), ignore_errors=True)
+                for leftover in ("start.bat", "a1.1.1.jar"):
+                    if os.path.exists(os.path.join(game_dir, leftover)):
+                        os.remove(os.path.join(game_dir, leftover))
+            elif name == "repair_one_corrupt":
+                corrupt_file(os.path.join(game_dir, "minecraft", "libraries", *first_library.split("/")))
+
+            before = dict(BenchHandler.stats)
+            seconds, exit_code = run_launcher(game_dir, archive_url, resources_url, commands[name],
+                                              os.path.join(log_dir, f"{name}-{repetition}.log"))
+            runs[name].append({
+                "seconds": seconds,
+                "exit_code": exit_code,
+                "requests": BenchHandler.stats["requests"] - before["requests"],
+                "bytes": BenchHandler.stats["bytes"] - before["bytes"],
+                "failures": BenchHandler.stats["failures"] - before["failures"],
+            })
+            print(f"⏱️  {name:<20} run {repetition + 1}/{args.repeat}: {seconds:.3f}s (exit {exit_code}, "
+                  f"{runs[name][-1]['requests']} requests, {runs[name][-1]['bytes'] / (1024 * 1024):.2f} MB)")
+    server.shutdown()
+
+    results = {
+        "version": version_label(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "compare", "keep")},
+        "scenarios": {},
+    }
+    for name in SCENARIOS:
+        seconds = [run["seconds"] for run in runs[name]]
+        results["scenarios"][name] = {
+            "median": statistics.median(seconds),
+            "min": min(seconds),
+            "max": max(seconds),
+            "runs": runs[name],
+        }
+
+    output_path = args.output or os.path.join(repo_dir, "benchmarks", "results", f"{results['version']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, "w") as f:
+        json.dump(results, f, indent=1)
+    print(f"\n✅ Results written to {output_path}")
+
+    regressions = compare_results(results, args.compare, args.threshold) if args.compare else 0
+
+    if args.keep:
+        print(f"📁 Workspace kept in {workspace}")
+    else:
+        shutil.rmtree(workspace, ignore_errors=True)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+# === Minecraft Alpha a1.1.1 installer and launcher ===
+# The submodules import their heavy dependencies (requests, zipfile, subprocess)
+# only on the code paths that need them, so importing this package stays cheap.
@@ -0,0 +1,115 @@
+import os
+import time
+import shutil
+
+from launcher import trace
+
+from launcher.download import SPOOL_MAX_SIZE
+from launcher.state import file_crc32
+
+# === Function to tell which members of a native jar are the 32-bit or the 64-bit twin of another member ===
+def arch_twins(names):
+    names = set(names)
+    only_32 = set()
+    only_64 = set()
+    for name in names:
+        base, ext = os.path.splitext(name)
+        twins = [base + "64" + ext, base + "_64" + ext]
+        if base.endswith("32"):
+            twins.append(base[:-2] + "64" + ext)
+        for twin in twins:
+            if twin in names:
+                only_32.add(name)
+                only_64.add(twin)
+    return only_32, only_64
+
+# === Function to extract a zip, skipping members whose size and CRC32 already match ===
+# With arch ("32" or "64") the other architecture's twins are not extracted (except the names in keep),
+# and copies left by an earlier extraction of the whole jar are removed unless remove_unwanted is False
+def extract_zip(source, target_folder, exclude=(), arch=None, keep=(), remove_unwanted=True):
+    import tempfile
+    import zipfile
+
+    # Zip files need random access, so a pipe is first spooled into memory
+    if not isinstance(source, str) and not source.seekable():
+        spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        shutil.copyfileobj(source, spooled, 65536)
+        spooled.seek(0)
+        source = spooled
+
+    start = time.perf_counter()
+    extracted = 0
+    skipped = 0
+    members = {}
+    target_root = os.path.realpath(target_folder)
+    with zipfile.ZipFile(source, "r") as zip_ref:
+        unwanted = set()
+        if arch is not None:
+            only_32, only_64 = arch_twins(zip_ref.namelist())
+            unwanted = (only_32 if arch == "64" else only_64) - set(keep)
+        for info in zip_ref.infolist():
+            if info.is_dir() or any(info.filename.startswith(prefix) for prefix in exclude):
+                continue
+            target_path = os.path.realpath(os.path.join(target_root, info.filename))
+            if not target_path.startswith(target_root + os.sep):
+                continue
+            if info.filename in unwanted:
+                if remove_unwanted and os.path.isfile(target_path):
+                    os.remove(target_path)
+                continue
+            if os.path.isfile(target_path) and os.path.getsize(target_path) == info.file_size and file_crc32(target_path) == info.CRC:
+                skipped += 1
+            else:
+                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                temp_path = target_path + ".tmp"
+                with zip_ref.open(info) as member, open(temp_path, "wb") as f:
+                    shutil.copyfileobj(member, f, 65536)
+                os.replace(temp_path, target_path)
+                extracted += 1
+            members[info.filename] = {"size": info.file_size, "crc": info.CRC, "mtime_ns": os.stat(target_path).st_mtime_ns}
+    trace.add("files_extracted", extracted)
+    trace.event("extract", target=target_folder, files=extracted, skipped=skipped,
+                seconds=round(time.perf_counter() - start, 6))
+    return extracted, skipped, members
+
+# === META-INF entries kept when jars are merged (service registrations are concatenated) ===
+MERGED_SERVICES_PREFIX = "META-INF/services/"
+
+# === Function to merge jars into one, keeping the first copy of every entry like the classpath does ===
+def merge_jars(sources, target_path):
+    import zipfile
+
+    seen = set()
+    services = {}
+    entries = 0
+    dropped = 0
+    temp_path = target_path + ".tmp"
+    with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as merged:
+        merged.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\r\n\r\n")
+        for source in sources:
+            with zipfile.ZipFile(source, "r") as jar:
+                for info in jar.infolist():
+                    name = info.filename
+                    if name.startswith(MERGED_SERVICES_PREFIX) and not info.is_dir():
+                        services.setdefault(name, []).append(jar.read(info).rstrip(b"\r\n"))
+                        continue
+                    # Signatures, manifests and build metadata of the input jars are not needed at run time
+                    if name.startswith("META-INF/") or name in seen:
+                        dropped += 1
+                        continue
+                    seen.add(name)
+
+                    if info.is_dir():
+                        merged.writestr(zipfile.ZipInfo(name, info.date_time), b"")
+                    else:
+                        target_info = zipfile.ZipInfo(name, info.date_time)
+                        target_info.compress_type = zipfile.ZIP_DEFLATED
+                        with jar.open(info) as member, merged.open(target_info, "w") as f:
+                            shutil.copyfileobj(member, f, 65536)
+                    entries += 1
+
+        for name, parts in services.items():
+            merged.writestr(name, b"\n".join(parts) + b"\n")
+            entries += 1
+    os.replace(temp_path, target_path)
+    return entries, dropped
@@ -0,0 +1,294 @@
+import os
+import json
+import time
+import hashlib
+
+from launcher import trace
+from launcher.archive import extract_zip
+from launcher.files import link_or_copy
+from launcher.i18n import say, text
+from launcher.state import check_sha1
+
+# === Asset archive for Alpha a1.1.1 ===
+ASSETS_ZIP_URL = "https://archive.org/download/alpha-1.1.1/resources.zip"
+
+# === Content-addressed asset object server ===
+RESOURCES_URL = "https://resources.download.minecraft.net"
+
+# === Files per task handed to a verify-assets worker ===
+HASH_BATCH_SIZE = 32
+
+# === Download assets (returns False when they could not be installed) ===
+def download_assets(installer):
+    layout = installer.layout
+    assets_zip_path = os.path.join(layout.assets_folder, "resources.zip")
+
+    say("assets_downloading")
+    try:
+        if not os.path.exists(assets_zip_path):
+            start = time.perf_counter()
+            status, written = installer.downloader.fetch_cached(ASSETS_ZIP_URL, assets_zip_path)
+            installer.downloader.add_stats(1 if status == "downloaded" else 0, written, time.perf_counter() - start)
+            if status == "downloaded":
+                say("downloaded", path=ASSETS_ZIP_URL)
+            elif status in ("not_modified", "cached"):
+                say("cache_hit", path=ASSETS_ZIP_URL)
+            else:
+                say("size_mismatch" if status == "size_mismatch" else "sha1_mismatch", path=ASSETS_ZIP_URL)
+                return False
+        else:
+            say("assets_zip_exists", path=assets_zip_path)
+
+        # Extract resources
+        say("assets_extracting", path=layout.assets_folder)
+        extracted, skipped, members = extract_zip(assets_zip_path, layout.virtual_assets_folder)
+        say("assets_extracted", extracted=extracted, skipped=skipped)
+        installer.install_state["assets_archive"] = {"url": ASSETS_ZIP_URL, "files": members}
+        installer.save_install_state()
+        os.remove(assets_zip_path)
+        say("deleted_temp_file", path=assets_zip_path)
+        return True
+    except Exception as e:
+        say("assets_error", error=e)
+        say("assets_manual_download")
+        say("assets_manual_extract")
+        return False
+
+# === Function to list the local asset source files that are missing or stale in the legacy asset folder ===
+def plan_local_assets(source_folder, virtual_folder):
+    pending = []
+    present = 0
+    for root, _, files in os.walk(source_folder):
+        for name in files:
+            source_path = os.path.join(root, name)
+            target_path = os.path.join(virtual_folder, os.path.relpath(source_path, source_folder))
+            present += 1
+            if os.path.exists(target_path):
+                source_stat = os.stat(source_path)
+                target_stat = os.stat(target_path)
+                if os.path.samestat(source_stat, target_stat) or (source_stat.st_size == target_stat.st_size
+                                                                  and source_stat.st_mtime_ns == target_stat.st_mtime_ns):
+                    continue
+            pending.append((source_path, target_path))
+    return pending, present
+
+# === Populate the legacy asset folder from the local asset source ===
+def populate_assets_from_local_source(source_folder, virtual_folder):
+    pending, present = plan_local_assets(source_folder, virtual_folder)
+    for source_path, target_path in pending:
+        link_or_copy(source_path, target_path)
+    say("assets_local_linked", linked=len(pending), present=present, source=source_folder)
+    return present
+
+# === Function to build one download job per object hash in the asset index ===
+def build_asset_jobs(objects, objects_folder):
+    asset_jobs = {}
+    for name, obj in objects.items():
+        object_hash = obj["hash"]
+        if object_hash not in asset_jobs:
+            asset_jobs[object_hash] = {
+                "url": f"{RESOURCES_URL}/{object_hash[:2]}/{object_hash}",
+                "path": name,
+                "local_path": os.path.join(objects_folder, object_hash[:2], object_hash),
+                "sha1": object_hash,
+                "size": obj.get("size"),
+                "kind": "asset",
+                "names": [],
+            }
+        asset_jobs[object_hash]["names"].append(name)
+    return asset_jobs
+
+# === Paths of the cached asset index, the object store and the virtual view ===
+def asset_index_paths(installer):
+    asset_index = installer.version_data["assetIndex"]
+    assets_folder = installer.layout.assets_folder
+    index_path = os.path.join(assets_folder, "indexes", asset_index["id"] + ".json")
+    objects_folder = os.path.join(assets_folder, "objects")
+    virtual_folder = os.path.join(assets_folder, "virtual", asset_index["id"])
+    return index_path, objects_folder, virtual_folder
+
+# === Function to count asset objects and virtual files that need work (no hashing) ===
+def plan_index_assets(installer):
+    manifest = installer.manifest
+    index_path, objects_folder, virtual_folder = asset_index_paths(installer)
+    with open(index_path, "r") as f:
+        asset_jobs = build_asset_jobs(json.load(f)["objects"], objects_folder)
+
+    stale_objects = 0
+    stale_links = 0
+    for job in asset_jobs.values():
+        if not manifest.matches(job["local_path"], job["sha1"]):
+            stale_objects += 1
+            continue
+        for name in job["names"]:
+            target_path = os.path.join(virtual_folder, *name.split("/"))
+            if not (os.path.exists(target_path) and (os.path.samefile(job["local_path"], target_path)
+                                                     or manifest.matches(target_path, job["sha1"]))):
+                stale_links += 1
+    return stale_objects, stale_links, virtual_folder
+
+# === Function to load the cached asset index, downloading it when it is missing or corrupt ===
+def load_asset_index(installer):
+    manifest = installer.manifest
+    asset_index = installer.version_data["assetIndex"]
+    index_path = asset_index_paths(installer)[0]
+    try:
+        if not manifest.is_verified(index_path, asset_index["sha1"]):
+            status, _ = installer.downloader.download_job({"url": asset_index["url"], "local_path": index_path,
+                                                           "sha1": asset_index["sha1"], "size": asset_index.get("size"),
+                                                           "cache": True})
+            if status not in ("downloaded", "linked", "not_modified", "cached"):
+                say("sha1_mismatch", path=asset_index["url"])
+                return None
+            say("assets_index_downloaded", index=asset_index["id"])
+        with open(index_path, "r") as f:
+            return json.load(f)["objects"]
+    except Exception as e:
+        say("assets_index_error", error=e)
+        return None
+
+# === Incremental asset sync driven by the asset index (returns the number of objects that could not be fetched) ===
+def sync_assets_from_index(installer):
+    manifest = installer.manifest
+    asset_index = installer.version_data["assetIndex"]
+    _, objects_folder, virtual_folder = asset_index_paths(installer)
+    source_folder = installer.local_assets_folder
+
+    say("assets_index_syncing", index=asset_index["id"])
+    objects = load_asset_index(installer)
+    if objects is None:
+        return 1
+
+    # Only objects that are missing or corrupt in the content-addressed store are downloaded
+    asset_jobs = build_asset_jobs(objects, objects_folder)
+
+    # Objects the local asset source already has are linked into the store instead of downloaded
+    if os.path.isdir(source_folder):
+        seeded = 0
+        for job in asset_jobs.values():
+            if manifest.is_verified(job["local_path"], job["sha1"]):
+                continue
+            for name in job["names"]:
+                source_path = os.path.join(source_folder, *name.split("/"))
+                if (os.path.isfile(source_path) and os.path.getsize(source_path) == job["size"]
+                        and check_sha1(source_path, job["sha1"])):
+                    link_or_copy(source_path, job["local_path"])
+                    manifest.record(job["local_path"], job["sha1"])
+                    seeded += 1
+                    break
+        say("assets_local_seeded", seeded=seeded, source=source_folder)
+
+    ready = installer.downloader.download_all(list(asset_jobs.values()))
+    say("assets_objects_present", ready=len(ready), total=len(asset_jobs), path=objects_folder)
+
+    # Materialize the virtual view from the object store
+    linked = 0
+    for job in ready:
+        for name in job["names"]:
+            target_path = os.path.join(virtual_folder, *name.split("/"))
+            if os.path.exists(target_path) and (os.path.samefile(job["local_path"], target_path) or manifest.is_verified(target_path, job["sha1"])):
+                continue
+            link_or_copy(job["local_path"], target_path)
+            linked += 1
+    manifest.save()
+    say("assets_virtual_updated", linked=linked, path=virtual_folder)
+    return len(asset_jobs) - len(ready)
+
+# === Function to hash a batch of files (runs in a worker process) ===
+def hash_files(paths):
+    results = []
+    for path in paths:
+        start = time.perf_counter()
+        sha1 = hashlib.sha1()
+        size = 0
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    sha1.update(chunk)
+                    size += len(chunk)
+        except OSError:
+            results.append((path, None, 0, 0.0))
+            continue
+        results.append((path, sha1.hexdigest(), size, time.perf_counter() - start))
+    return results
+
+# === verify-assets: hash the legacy asset folder on every core and check it against the asset index ===
+def verify_assets(installer, workers, fix=False):
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+    manifest = installer.manifest
+    virtual_folder = asset_index_paths(installer)[2]
+    installer.layout.create()
+    objects = load_asset_index(installer)
+    if objects is None:
+        return 1
+
+    expected = {os.path.join(virtual_folder, *name.split("/")): (name, obj["hash"], obj.get("size")) for name, obj in objects.items()}
+    paths = sorted(expected)
+    batches = [paths[i:i + HASH_BATCH_SIZE] for i in range(0, len(paths), HASH_BATCH_SIZE)]
+    workers = max(1, workers)
+    say("verify_assets_start", files=len(paths), path=virtual_folder, workers=workers)
+
+    # Worker processes sidestep the GIL for the many small files; threads are the fallback where processes are unavailable
+    try:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    except (OSError, NotImplementedError, ImportError):
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+    mismatches = []
+    done = 0
+    hashed_bytes = 0
+    start = time.perf_counter()
+    with executor:
+        for future in as_completed([executor.submit(hash_files, batch) for batch in batches]):
+            for path, sha1, size, seconds in future.result():
+                name, expected_sha1, expected_size = expected[path]
+                done += 1
+                if sha1 is None:
+                    mismatches.append((name, "missing"))
+                    manifest.forget(path)
+                    continue
+                trace.hashed(path, size, seconds)
+                hashed_bytes += size
+                if sha1 == expected_sha1:
+                    manifest.record(path, sha1)
+                else:
+                    mismatches.append((name, "size" if expected_size is not None and size != expected_size else "sha1"))
+                    manifest.forget(path)
+            seconds = max(time.perf_counter() - start, 0.001)
+            print(text("verify_assets_progress", done=done, total=len(paths), megabytes=hashed_bytes / (1024 * 1024),
+                       speed=hashed_bytes / (1024 * 1024) / seconds), end="\r", flush=True)
+    print()
+    manifest.save()
+
+    seconds = max(time.perf_counter() - start, 0.001)
+    say("verify_assets_done", files=done, megabytes=hashed_bytes / (1024 * 1024), seconds=seconds,
+        speed=hashed_bytes / (1024 * 1024) / seconds, rate=done / seconds)
+    if not mismatches:
+        say("verify_assets_ok")
+        return 0
+
+    say("verify_assets_mismatches", count=len(mismatches))
+    for name, reason in sorted(mismatches):
+        print(f"   {text('verify_assets_' + reason):<10} {name}")
+    print()
+    if not fix:
+        say("verify_assets_hint")
+        return 1
+
+    # Only the mismatched files are fetched again, straight from the object server
+    jobs = []
+    for name, _ in mismatches:
+        obj = objects[name]
+        jobs.append({
+            "url": f"{RESOURCES_URL}/{obj['hash'][:2]}/{obj['hash']}",
+            "path": name,
+            "local_path": os.path.join(virtual_folder, *name.split("/")),
+            "sha1": obj["hash"],
+            "size": obj.get("size"),
+            "kind": "asset",
+        })
+    ready = installer.downloader.download_all(jobs)
+    installer.downloader.print_summary()
+    say("verify_assets_fixed", fixed=len(ready), count=len(jobs))
+    return 0 if len(ready) == len(jobs) else 1
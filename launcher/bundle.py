@@ -0,0 +1,252 @@
+import io
+import os
+import json
+import time
+import shutil
+import tarfile
+
+from launcher import trace
+from launcher.i18n import say
+from launcher.layout import NATIVE_OS
+from launcher.state import VerifyManifest, check_sha1, file_sha1, load_json, save_json
+
+# === Bundle format: bundle.json first, then one objects/<sha1> member per distinct file content ===
+BUNDLE_FORMAT = 1
+BUNDLE_MANIFEST = "bundle.json"
+
+# === Install state that only makes sense on the machine that wrote it ===
+HOST_STATE_KEYS = ("store", "cds")
+
+# === Function to turn a bundle path into a path in the installation (None for anything export never writes) ===
+def bundle_target(layout, relative_path):
+    main_dir = os.path.abspath(layout.main_dir)
+    target_path = os.path.normpath(os.path.join(main_dir, *relative_path.split("/")))
+    if os.path.isabs(relative_path):
+        return None
+
+    # Only the folders and files export_paths() packs; the scripts, a1.1.1.json and state files stay out of reach
+    folders = [layout.libraries_folder, layout.assets_folder] + [layout.natives_folder_for(os_name) for os_name in NATIVE_OS.values()]
+    files = [layout.game_jar, layout.start_bat, layout.launch_manifest_path, layout.merged_jar]
+    for folder in folders:
+        folder = os.path.abspath(folder)
+        if target_path != folder and os.path.commonpath([folder, target_path]) == folder:
+            return target_path
+    if target_path in [os.path.abspath(path) for path in files]:
+        return target_path
+    return None
+
+# === Function to list what export packs: the verified installation and the generated launcher ===
+def export_paths(installer):
+    layout = installer.layout
+    folders = [layout.libraries_folder, layout.assets_folder] + [layout.natives_folder_for(os_name) for os_name in installer.native_os_list]
+    paths = []
+    for folder in folders:
+        for root, _, files in os.walk(folder):
+            for name in files:
+                if not name.endswith((".part", ".part.json", ".tmp")):
+                    paths.append(os.path.join(root, name))
+
+    files = [layout.game_jar, layout.start_bat, layout.launch_manifest_path]
+    if installer.merge_jars:
+        files.append(layout.merged_jar)
+    paths.extend(path for path in files if os.path.exists(path))
+    return paths
+
+# === Function to name how the assets were installed, the same way plan() picks the asset source ===
+def export_asset_mode(installer):
+    if installer.asset_mode == "index":
+        return "index"
+    if installer.asset_mode == "auto" and os.path.isdir(installer.local_assets_folder):
+        return "local"
+    return "archive"
+
+# === export: stream the installation into one compressed archive, each distinct file stored once ===
+def export_bundle(installer, bundle_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    layout = installer.layout
+    main_dir = os.path.abspath(layout.main_dir)
+
+    # Only a complete installation is exported, so the bundle never carries a file that failed its check
+    with trace.phase("verify"):
+        plan = installer.verify()
+    if plan:
+        say("export_not_installed")
+        installer.print_plan(plan)
+        return 1
+
+    # The verification manifest already knows most SHA1s; extracted natives and assets are hashed here
+    paths = export_paths(installer)
+    manifest = installer.manifest
+    known = {}
+    for file_path in paths:
+        entry = manifest.entries.get(manifest.key(file_path))
+        if entry and manifest.matches(file_path, entry["sha1"]):
+            known[file_path] = entry["sha1"]
+
+    say("export_start", files=len(paths), path=bundle_path)
+    with trace.phase("export"):
+        with ThreadPoolExecutor(max_workers=installer.downloader.max_workers) as executor:
+            hashed = dict(zip([path for path in paths if path not in known],
+                              executor.map(file_sha1, [path for path in paths if path not in known])))
+
+        files = {}
+        objects = {}
+        duplicate_bytes = 0
+        for file_path in paths:
+            sha1 = known.get(file_path) or hashed[file_path]
+            st = os.stat(file_path)
+            files[os.path.relpath(file_path, main_dir).replace(os.sep, "/")] = [sha1, st.st_mtime_ns]
+            if sha1 in objects:
+                duplicate_bytes += st.st_size
+            else:
+                objects[sha1] = file_path
+
+        install_state = {key: value for key, value in installer.install_state.items() if key not in HOST_STATE_KEYS}
+        bundle = {
+            "format": BUNDLE_FORMAT,
+            "version": installer.version_data["id"],
+            "created": round(time.time()),
+            "assets": export_asset_mode(installer),
+            "install_state": install_state,
+            "files": files,
+            "verified": sorted(os.path.relpath(file_path, main_dir).replace(os.sep, "/") for file_path in known),
+            "objects": {sha1: os.path.getsize(file_path) for sha1, file_path in objects.items()},
+        }
+
+        temp_path = bundle_path + ".tmp"
+        with tarfile.open(temp_path, "w:gz", compresslevel=6) as tar:
+            data = json.dumps(bundle).encode()
+            info = tarfile.TarInfo(BUNDLE_MANIFEST)
+            info.size = len(data)
+            info.mtime = bundle["created"]
+            tar.addfile(info, io.BytesIO(data))
+
+            for sha1, file_path in objects.items():
+                info = tarfile.TarInfo(f"objects/{sha1}")
+                info.size = bundle["objects"][sha1]
+                info.mtime = bundle["created"]
+                with open(file_path, "rb") as f:
+                    tar.addfile(info, f)
+        os.replace(temp_path, bundle_path)
+
+    say("export_done", path=bundle_path, files=len(files), objects=len(objects),
+        megabytes=os.path.getsize(bundle_path) / (1024 * 1024), saved=duplicate_bytes / (1024 * 1024))
+    return 0
+
+# === Function to place one more copy of an object: a hardlink when the recorded mtimes agree, a copy otherwise ===
+def place_copy(source_path, target_path, mtime_ns):
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    if os.path.lexists(target_path):
+        os.remove(target_path)
+    if os.stat(source_path).st_mtime_ns == mtime_ns:
+        try:
+            os.link(source_path, target_path)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(source_path, target_path)
+    os.utime(target_path, ns=(mtime_ns, mtime_ns))
+
+# === Function to check one unpacked object and only then move it into place, linked or copied to every path with its content ===
+def install_object(temp_path, sha1, targets):
+    if not check_sha1(temp_path, sha1):
+        os.remove(temp_path)
+        return False
+    (first_path, mtime_ns), *others = targets
+    os.replace(temp_path, first_path)
+    os.utime(first_path, ns=(mtime_ns, mtime_ns))
+    for target_path, other_mtime_ns in others:
+        place_copy(first_path, target_path, other_mtime_ns)
+    return True
+
+# === import: unpack a bundle as a stream, hashing every object in parallel while the next one is read ===
+def import_bundle(layout, bundle_path, workers):
+    from concurrent.futures import ThreadPoolExecutor
+
+    main_dir = os.path.abspath(layout.main_dir)
+    with open(layout.json_path, "r") as f:
+        version = json.load(f)["id"]
+
+    start = time.perf_counter()
+    layout.create()
+    futures = {}
+    written = 0
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor, tarfile.open(bundle_path, "r|gz") as tar:
+            member = tar.next()
+            if member is None or member.name != BUNDLE_MANIFEST:
+                say("import_bad_bundle", path=bundle_path)
+                return None
+            bundle = json.load(tar.extractfile(member))
+            if bundle.get("format") != BUNDLE_FORMAT or bundle.get("version") != version:
+                say("import_wrong_bundle", path=bundle_path, version=bundle.get("version"), expected=version)
+                return None
+
+            targets = {}
+            for relative_path, (sha1, mtime_ns) in bundle["files"].items():
+                target_path = bundle_target(layout, relative_path)
+                if target_path is None:
+                    say("import_unsafe_path", path=bundle_path, file=relative_path)
+                    return None
+                targets.setdefault(sha1, []).append((target_path, mtime_ns))
+            say("import_start", path=bundle_path, files=len(bundle["files"]), objects=len(bundle["objects"]))
+
+            for member in tar:
+                sha1 = member.name[len("objects/"):]
+                if not member.name.startswith("objects/") or sha1 not in targets or sha1 in futures:
+                    continue
+
+                # Streamed into a temporary file; a worker checks it before it replaces anything
+                first_path = targets[sha1][0][0]
+                os.makedirs(os.path.dirname(first_path), exist_ok=True)
+                temp_path = f"{first_path}.{os.getpid()}.tmp"
+                with open(temp_path, "wb") as f:
+                    shutil.copyfileobj(tar.extractfile(member), f, 1024 * 1024)
+                written += member.size
+
+                futures[sha1] = executor.submit(install_object, temp_path, sha1, targets[sha1])
+    except (OSError, ValueError, KeyError, tarfile.TarError) as e:
+        say("import_error", path=bundle_path, error=e)
+        return None
+
+    failed = [sha1 for sha1 in targets if sha1 not in futures or not futures[sha1].result()]
+    for sha1 in failed:
+        say("import_corrupt", sha1=sha1, path=os.path.relpath(targets[sha1][0][0], main_dir))
+    if failed:
+        say("import_failed", count=len(failed))
+        return None
+
+    # Fresh inodes and mtimes: the verification manifest is rebuilt from the hashes just checked
+    manifest = VerifyManifest(layout.manifest_path, layout.minecraft_dir)
+    for relative_path in bundle["verified"]:
+        manifest.record(bundle_target(layout, relative_path), bundle["files"][relative_path][0])
+    manifest.save()
+
+    # This machine keeps its own store choice and class-data-sharing archive
+    previous_state = load_json(layout.install_state_path)
+    install_state = dict(bundle["install_state"])
+    install_state.update({key: previous_state[key] for key in HOST_STATE_KEYS if key in previous_state})
+    save_json(layout.install_state_path, install_state)
+
+    seconds = time.perf_counter() - start
+    say("import_done", files=len(bundle["files"]), objects=len(futures), seconds=seconds,
+        megabytes=written / (1024 * 1024))
+    return bundle
+
+# === After import: regenerate the launcher for this machine, offline, and report anything still missing ===
+def finish_import(installer, bundle):
+    plan = installer.plan()
+    # Assets copied from a local folder have no record the installer could check; the import just verified them
+    if bundle["assets"] == "local":
+        plan = [step for step in plan if step[1] != "assets"]
+    local_plan = [step for step in plan if step[1] in ("launcher", "store")]
+    missing = [step for step in plan if step not in local_plan]
+    if local_plan and installer.execute(local_plan):
+        return 1
+    if missing:
+        say("import_incomplete")
+        installer.print_plan(missing)
+        return 1
+    say("import_ready")
+    return 0
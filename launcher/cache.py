@@ -0,0 +1,104 @@
+import os
+import time
+import hashlib
+import threading
+
+from launcher import trace
+from launcher.files import file_lock
+from launcher.layout import user_cache_folder
+from launcher.state import load_json, save_json
+
+# === Default cap on the cached response bodies ===
+DEFAULT_CACHE_MB = 512
+
+# === Function to get the default HTTP cache folder ===
+def default_cache_folder():
+    return os.path.join(user_cache_folder(), "http")
+
+# === HTTP cache: one body per URL plus its ETag / Last-Modified, evicted least recently used first ===
+class HttpCache:
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.bodies_folder = os.path.join(root, "bodies")
+        self.index_path = os.path.join(root, "index.json")
+        self.lock = threading.Lock()
+        self.entries = load_json(self.index_path)
+
+    # === Write the index under a lock, keeping what other processes recorded and evicting down to the cap ===
+    def save(self, keep=None):
+        os.makedirs(self.root, exist_ok=True)
+        with file_lock(self.index_path + ".lock"):
+            self.merge()
+            self.evict(keep)
+            with self.lock:
+                save_json(self.index_path, self.entries)
+
+    # Take in the index on disk: the most recently used entry per URL wins, entries without their body are dropped
+    def merge(self):
+        on_disk = load_json(self.index_path)
+        with self.lock:
+            for url in set(on_disk) | set(self.entries):
+                entry = max((entry for entry in (self.entries.get(url), on_disk.get(url)) if entry is not None),
+                            key=lambda entry: entry["used"])
+                try:
+                    body_matches = os.path.getsize(self.body_path(url)) == entry["size"]
+                except OSError:
+                    body_matches = False
+                if body_matches:
+                    self.entries[url] = entry
+                else:
+                    self.entries.pop(url, None)
+
+    # Lock held while one URL's body is revalidated and served, so concurrent installs never write the same .part file
+    def url_lock(self, url, blocking=True):
+        return file_lock(self.body_path(url) + ".lock", blocking)
+
+    def body_path(self, url):
+        return os.path.join(self.bodies_folder, hashlib.sha1(url.encode()).hexdigest())
+
+    # Cached entry for a URL, or None when its body is gone or was changed on disk
+    def lookup(self, url):
+        with self.lock:
+            entry = self.entries.get(url)
+        try:
+            if entry is not None and os.path.getsize(self.body_path(url)) == entry["size"]:
+                return entry
+        except OSError:
+            pass
+        return None
+
+    def touch(self, url):
+        with self.lock:
+            self.entries[url]["used"] = time.time()
+        self.save(keep=url)
+
+    # === Remember a freshly downloaded body with its validators, then enforce the size cap ===
+    def record(self, url, validators):
+        with self.lock:
+            self.entries[url] = {
+                "etag": validators.get("etag"),
+                "last_modified": validators.get("last_modified"),
+                "sha1": validators.get("sha1"),
+                "size": os.path.getsize(self.body_path(url)),
+                "used": time.time(),
+            }
+        self.save(keep=url)
+
+    # The entry being served is never evicted, even when it alone is over the cap (called by save() under its lock)
+    def evict(self, keep=None):
+        with self.lock:
+            total = sum(entry["size"] for entry in self.entries.values())
+            for url in sorted(self.entries, key=lambda url: self.entries[url]["used"]):
+                if total <= self.max_bytes:
+                    break
+                if url == keep:
+                    continue
+                # A body another process is serving right now stays until a later save
+                with self.url_lock(url, blocking=False) as locked:
+                    if not locked:
+                        continue
+                    total -= self.entries.pop(url)["size"]
+                    if os.path.exists(self.body_path(url)):
+                        os.remove(self.body_path(url))
+                trace.event("cache_evict", url=url)
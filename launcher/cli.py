@@ -0,0 +1,177 @@
+import os
+import argparse
+
+from launcher import trace
+from launcher.i18n import say, set_language, text
+from launcher.layout import Layout
+
+COMMANDS = ("install", "verify", "launch", "repair", "gc", "provision", "verify-assets", "export", "import")
+
+# === Command line options ===
+def build_parser():
+    parser = argparse.ArgumentParser(description=text("description"))
+    subparsers = parser.add_subparsers(dest="command")
+
+    for command in COMMANDS:
+        subparser = subparsers.add_parser(command, help=text(f"help_{command}"))
+        if command == "launch":
+            subparser.add_argument("--instance", metavar="DIR", help=text("help_instance"))
+            subparser.add_argument("--no-supervise", dest="supervise", action="store_false", help=text("help_no_supervise"))
+            subparser.add_argument("--stats", action="store_true", help=text("help_stats"))
+            continue
+        if command == "gc":
+            subparser.add_argument("--store", metavar="DIR", help=text("help_gc_store"))
+            continue
+        subparser.add_argument("--asset-source", help=text("help_asset_source"))
+        subparser.add_argument("--assets", choices=["auto", "archive", "index"], default="auto", help=text("help_assets"))
+        subparser.add_argument("--trace", metavar="FILE", help=text("help_trace"))
+        subparser.add_argument("--timings", action="store_true", help=text("help_timings"))
+        if command == "verify-assets":
+            subparser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help=text("help_workers"))
+            subparser.add_argument("--fix", action="store_true", help=text("help_fix"))
+        if command == "export":
+            subparser.add_argument("file", nargs="?", default="a1.1.1-bundle.tar.gz", help=text("help_export_file"))
+        if command == "import":
+            subparser.add_argument("file", help=text("help_import_file"))
+            subparser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help=text("help_import_workers"))
+            subparser.set_defaults(offline=True)
+        if command in ("verify", "export", "import"):
+            continue
+        subparser.add_argument("--jobs", type=int, default=8, help=text("help_jobs"))
+        subparser.add_argument("--mirror", action="append", default=[], metavar="URL_OR_DIR", help=text("help_mirror"))
+        subparser.add_argument("--store", nargs="?", const=True, metavar="DIR", help=text("help_store"))
+        subparser.add_argument("--no-store", dest="store", action="store_const", const=False, help=text("help_no_store"))
+        subparser.add_argument("--cache-size", type=int, metavar="MB", help=text("help_cache_size"))
+        subparser.add_argument("--offline", action="store_true", help=text("help_offline"))
+        if command == "install":
+            subparser.add_argument("--full-verify", action="store_true", help=text("help_full_verify"))
+            subparser.add_argument("--dry-run", action="store_true", help=text("help_dry_run"))
+        if command in ("install", "provision"):
+            subparser.add_argument("--merge-jars", action=argparse.BooleanOptionalAction, help=text("help_merge_jars"))
+            subparser.add_argument("--profile", help=text("help_profile"))
+        if command == "provision":
+            subparser.add_argument("count", type=int, help=text("help_count"))
+            subparser.add_argument("--player", default="Player{n}", metavar="PATTERN", help=text("help_player"))
+            subparser.add_argument("--into", metavar="DIR", help=text("help_into"))
+    return parser
+
+# === Entry point shared by run-EN.py, run-PL.py and python -m launcher ===
+def main(argv=None, language="en", main_dir=None):
+    import sys
+
+    set_language(language)
+    argv = list(sys.argv[1:] if argv is None else argv)
+
+    # Plain "run-EN.py [--options]" keeps meaning install
+    if not argv or argv[0] not in COMMANDS + ("-h", "--help"):
+        argv.insert(0, "install")
+    args = build_parser().parse_args(argv)
+
+    layout = Layout(main_dir or os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    # launch never needs the version JSON or the download engine
+    if args.command == "launch":
+        if args.instance:
+            layout = Layout(os.path.abspath(args.instance))
+        if args.stats:
+            from launcher.supervisor import launch_stats
+            return launch_stats(layout)
+        from launcher.launch import launch
+        return launch(layout, args.supervise)
+
+    if args.command == "gc":
+        return collect_garbage(args, layout)
+
+    trace.configure(args.trace)
+    try:
+        return run_installer(args, layout)
+    finally:
+        trace.finish(args.timings)
+
+# === install, verify and repair ===
+def run_installer(args, layout):
+    from launcher.installer import Installer
+
+    # import unpacks and verifies the bundle first; the installer then only regenerates the launcher, offline
+    if args.command == "import":
+        from launcher.bundle import import_bundle
+        with trace.phase("import"):
+            bundle = import_bundle(layout, os.path.abspath(args.file), args.workers)
+        if bundle is None:
+            return 1
+        if args.assets == "auto" and bundle["assets"] != "local":
+            args.assets = bundle["assets"]
+
+    try:
+        installer = Installer(layout,
+                              jobs=getattr(args, "jobs", 8),
+                              full_verify=args.command == "repair" or getattr(args, "full_verify", False),
+                              asset_mode=args.assets,
+                              asset_source=args.asset_source,
+                              merge_jars=getattr(args, "merge_jars", None),
+                              profile=getattr(args, "profile", None),
+                              mirrors=getattr(args, "mirror", []),
+                              store=getattr(args, "store", None),
+                              cache_size=getattr(args, "cache_size", None),
+                              offline=getattr(args, "offline", False),
+                              dry_run=getattr(args, "dry_run", False))
+    except (OSError, ValueError) as e:
+        say("json_error", error=e)
+        return 1
+
+    if installer.profile not in installer.profiles:
+        say("unknown_profile", profile=installer.profile, profiles=", ".join(installer.profiles))
+        return 1
+
+    if args.command == "verify":
+        with trace.phase("verify"):
+            plan = installer.verify()
+        if not plan:
+            say("verify_ok")
+            return 0
+        say("verify_problems")
+        installer.print_plan(plan)
+        return 1
+
+    if args.command == "provision":
+        from launcher.provision import provision
+        return provision(installer, args.count, os.path.abspath(args.into or os.path.join(layout.main_dir, "instances")), args.player)
+
+    if args.command == "export":
+        from launcher.bundle import export_bundle
+        return export_bundle(installer, os.path.abspath(args.file))
+
+    if args.command == "import":
+        from launcher.bundle import finish_import
+        return finish_import(installer, bundle)
+
+    if args.command == "verify-assets":
+        from launcher.assets import verify_assets
+        with trace.phase("verify-assets"):
+            return verify_assets(installer, args.workers, args.fix)
+
+    if args.command == "repair":
+        say("repair_start")
+
+    with trace.phase("plan"):
+        plan = installer.plan()
+    if not plan:
+        say("nothing_to_do")
+        return 0
+
+    say("plan_header")
+    installer.print_plan(plan)
+    if getattr(args, "dry_run", False):
+        return 0
+
+    return installer.execute(plan)
+
+# === gc: remove shared store objects no installation uses ===
+def collect_garbage(args, layout):
+    from launcher.state import load_json
+    from launcher.store import Store, default_store_folder, store_folder
+
+    folder = store_folder(args.store, load_json(layout.config_path), load_json(layout.install_state_path)) or default_store_folder()
+    say("store_gc_start", path=folder)
+    Store(folder).collect_garbage()
+    return 0
@@ -0,0 +1,445 @@
+import os
+import hashlib
+import threading
+import time
+
+from launcher import trace
+from launcher.files import link_or_copy
+from launcher.i18n import say, text
+from launcher.mirrors import MirrorList, is_local_mirror
+from launcher.state import load_json, save_json
+
+# === Archives up to this size are kept in memory instead of a temp file ===
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# === Raised when offline mode would need the network ===
+class OfflineError(Exception):
+    pass
+
+# === Resume state kept next to each .part file ===
+def discard_part(part_path, state_path):
+    for leftover in (part_path, state_path):
+        if os.path.exists(leftover):
+            os.remove(leftover)
+
+# === Download engine: shared keep-alive session and a bounded worker pool ===
+class Downloader:
+    def __init__(self, manifest, max_workers=8, mirrors=None, store=None, cache=None, offline=False):
+        self.manifest = manifest
+        self.mirrors = mirrors or MirrorList([])
+        self.store = store
+        self.cache = cache
+        self.offline = offline
+        self.max_workers = max(1, max_workers)
+        self.stats = {"files": 0, "bytes": 0, "seconds": 0.0}
+        self.stats_lock = threading.Lock()
+        self._session = None
+
+    # requests is only imported once something is actually downloaded
+    @property
+    def session(self):
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    def add_stats(self, files, written, seconds=0.0):
+        with self.stats_lock:
+            self.stats["files"] += files
+            self.stats["bytes"] += written
+            self.stats["seconds"] += seconds
+
+    # === Stream a download into a .part file, hashing the chunks as they arrive ===
+    # validators, when given, holds the cached ETag / Last-Modified to revalidate and receives the new ones
+    def stream_download(self, url, local_path, expected_sha1=None, expected_size=None, validators=None, record=True):
+        part_path = local_path + ".part"
+        state_path = part_path + ".json"
+        state = load_json(state_path)
+
+        # A part file is resumable from any mirror when the SHA1 pins down its content
+        same_url = state.get("url") == url
+        offset = 0
+        if os.path.exists(part_path) and state.get("sha1") == expected_sha1 and (expected_sha1 or same_url):
+            offset = os.path.getsize(part_path)
+            if expected_size is not None and offset >= expected_size:
+                offset = 0
+
+        # Re-hash the bytes we already have so the final SHA1 covers the whole file
+        sha1 = hashlib.sha1()
+        if offset:
+            with open(part_path, "rb") as f:
+                for chunk in iter(lambda: f.read(65536), b""):
+                    sha1.update(chunk)
+
+        headers = {}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        if offset and same_url:
+            validator = state.get("etag") if not (state.get("etag") or "").startswith("W/") else None
+            validator = validator or state.get("last_modified")
+            if validator:
+                headers["If-Range"] = validator
+        if validators and not offset:
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        written = 0
+        expected_total = expected_size
+        session = self.session
+        start = time.perf_counter()
+        try:
+            with session.get(url, stream=True, timeout=60, headers=headers) as response:
+                headers_seconds = time.perf_counter() - start
+                if offset and response.status_code == 416:
+                    discard_part(part_path, state_path)
+                    return self.stream_download(url, local_path, expected_sha1, expected_size, validators, record)
+                if response.status_code == 304:
+                    trace.download(url, 304, 0, headers_seconds, time.perf_counter() - start)
+                    return "not_modified", 0
+                response.raise_for_status()
+
+                content_range = response.headers.get("Content-Range", "")
+                if offset and (response.status_code != 206 or not content_range.startswith(f"bytes {offset}-")):
+                    # The server ignored the Range request - fall back to a full fetch
+                    offset = 0
+                    sha1 = hashlib.sha1()
+                if expected_total is None:
+                    if "/" in content_range and content_range.split("/")[-1].isdigit():
+                        expected_total = int(content_range.split("/")[-1])
+                    elif response.headers.get("Content-Length", "").isdigit():
+                        expected_total = offset + int(response.headers["Content-Length"])
+
+                state = {
+                    "url": url,
+                    "sha1": expected_sha1,
+                    "size": expected_total,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "bytes": offset,
+                }
+                save_json(state_path, state)
+
+                with open(part_path, "ab" if offset else "wb") as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+                        sha1.update(chunk)
+                        written += len(chunk)
+                        if expected_total is not None and offset + written > expected_total:
+                            break
+        except Exception:
+            # Keep the partial file so the next run can resume it
+            if os.path.exists(part_path) and state.get("url") == url:
+                state["bytes"] = os.path.getsize(part_path)
+                save_json(state_path, state)
+            raise
+
+        trace.download(url, response.status_code, written, headers_seconds, time.perf_counter() - start)
+        trace.streamed_hash(offset + written)
+        if expected_total is not None and offset + written != expected_total:
+            discard_part(part_path, state_path)
+            return "size_mismatch", written
+        if expected_sha1 and sha1.hexdigest() != expected_sha1:
+            discard_part(part_path, state_path)
+            return "mismatch", written
+
+        # Only a verified file replaces the destination
+        os.replace(part_path, local_path)
+        os.remove(state_path)
+        if validators is not None:
+            validators.update(etag=state["etag"], last_modified=state["last_modified"], sha1=sha1.hexdigest())
+        if expected_sha1 and record:
+            self.manifest.record(local_path, expected_sha1)
+        return "downloaded", written
+
+    # === Stream a download into a spooled buffer instead of a file ===
+    def stream_download_to_buffer(self, url, expected_sha1=None, expected_size=None):
+        import tempfile
+
+        buffer = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        sha1 = hashlib.sha1()
+        written = 0
+        session = self.session
+        start = time.perf_counter()
+        try:
+            with session.get(url, stream=True, timeout=60) as response:
+                headers_seconds = time.perf_counter() - start
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=65536):
+                    buffer.write(chunk)
+                    sha1.update(chunk)
+                    written += len(chunk)
+                    if expected_size is not None and written > expected_size:
+                        break
+        except Exception:
+            buffer.close()
+            raise
+
+        trace.download(url, response.status_code, written, headers_seconds, time.perf_counter() - start)
+        trace.streamed_hash(written)
+        if expected_size is not None and written != expected_size:
+            buffer.close()
+            return "size_mismatch", written, None
+        if expected_sha1 and sha1.hexdigest() != expected_sha1:
+            buffer.close()
+            return "mismatch", written, None
+        buffer.seek(0)
+        return "downloaded", written, buffer
+
+    # === Copy a file from a local mirror, hashing it on the way ===
+    def copy_local(self, source_path, local_path, expected_sha1=None, expected_size=None, record=True):
+        part_path = local_path + ".part"
+        start = time.perf_counter()
+        sha1 = hashlib.sha1()
+        written = 0
+        with open(source_path, "rb") as source, open(part_path, "wb") as f:
+            for chunk in iter(lambda: source.read(65536), b""):
+                f.write(chunk)
+                sha1.update(chunk)
+                written += len(chunk)
+        trace.download(source_path, "local", written, 0.0, time.perf_counter() - start)
+        trace.streamed_hash(written)
+
+        if (expected_size is not None and written != expected_size) or (expected_sha1 and sha1.hexdigest() != expected_sha1):
+            os.remove(part_path)
+            return "mismatch", written
+        os.replace(part_path, local_path)
+        discard_part(part_path, part_path + ".json")
+        if expected_sha1 and record:
+            self.manifest.record(local_path, expected_sha1)
+        return "downloaded", written
+
+    def copy_local_to_buffer(self, source_path, expected_sha1=None, expected_size=None):
+        import tempfile
+
+        start = time.perf_counter()
+        buffer = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        sha1 = hashlib.sha1()
+        written = 0
+        with open(source_path, "rb") as source:
+            for chunk in iter(lambda: source.read(65536), b""):
+                buffer.write(chunk)
+                sha1.update(chunk)
+                written += len(chunk)
+        trace.download(source_path, "local", written, 0.0, time.perf_counter() - start)
+        trace.streamed_hash(written)
+
+        if (expected_size is not None and written != expected_size) or (expected_sha1 and sha1.hexdigest() != expected_sha1):
+            buffer.close()
+            return "mismatch", written, None
+        buffer.seek(0)
+        return "downloaded", written, buffer
+
+    # === Fetch a URL from the fastest healthy mirror, failing over to the next source and finally upstream ===
+    def fetch(self, url, local_path=None, expected_sha1=None, expected_size=None):
+        if self.mirrors:
+            self.mirrors.probe(lambda: self.session)
+
+        for mirror, location in self.mirrors.candidates(url):
+            if mirror is None:
+                break
+            if self.offline and not is_local_mirror(mirror):
+                continue
+            try:
+                if is_local_mirror(mirror):
+                    if not os.path.isfile(location):
+                        continue
+                    if local_path is None:
+                        result = self.copy_local_to_buffer(location, expected_sha1, expected_size)
+                    else:
+                        result = self.copy_local(location, local_path, expected_sha1, expected_size)
+                elif local_path is None:
+                    result = self.stream_download_to_buffer(location, expected_sha1, expected_size)
+                else:
+                    result = self.stream_download(location, local_path, expected_sha1, expected_size)
+            except Exception as e:
+                if not is_local_mirror(mirror):
+                    import requests
+                    if isinstance(e, (requests.ConnectionError, requests.Timeout)):
+                        self.mirrors.mark_down(mirror)
+                trace.event("mirror_failed", mirror=mirror, url=url, error=str(e))
+                say("mirror_failed", mirror=mirror, url=url, error=e)
+                continue
+            if result[0] == "downloaded":
+                return result
+            trace.event("mirror_failed", mirror=mirror, url=url, error=result[0])
+            say("mirror_failed", mirror=mirror, url=url, error=result[0])
+
+        # Upstream is the last resort; its errors go to the caller
+        if self.offline:
+            raise OfflineError(text("offline_miss", url=url))
+        if local_path is None:
+            return self.stream_download_to_buffer(url, expected_sha1, expected_size)
+        return self.stream_download(url, local_path, expected_sha1, expected_size)
+
+    # === Fetch a URL through the HTTP cache: revalidate with ETag / Last-Modified, serve the body from disk ===
+    def fetch_cached(self, url, local_path, expected_sha1=None, expected_size=None):
+        cache = self.cache
+        if cache is None:
+            return self.fetch(url, local_path, expected_sha1, expected_size)
+
+        body_path = cache.body_path(url)
+        os.makedirs(cache.bodies_folder, exist_ok=True)
+
+        # Other installations share the cache; one process at a time fetches a URL, the next one finds its entry
+        with cache.url_lock(url):
+            cache.merge()
+            entry = cache.lookup(url)
+            if entry is not None and expected_sha1 and entry["sha1"] != expected_sha1:
+                entry = None
+
+            # Offline a cached copy is used as it is
+            if entry is not None and self.offline:
+                status, written = "cached", 0
+            else:
+                status, written = self.revalidate(url, body_path, entry, expected_sha1, expected_size)
+                if status not in ("downloaded", "not_modified", "cached"):
+                    return status, written
+
+            trace.event("cache", url=url, status=status)
+            link_or_copy(body_path, local_path)
+        if expected_sha1:
+            self.manifest.record(local_path, expected_sha1)
+        return status, written
+
+    # === Refresh a cache body from the mirrors in order, upstream last; a stale copy is kept when all of them fail ===
+    def revalidate(self, url, body_path, entry, expected_sha1, expected_size):
+        cache = self.cache
+        if self.mirrors:
+            self.mirrors.probe(lambda: self.session)
+
+        validators = {"etag": entry["etag"], "last_modified": entry["last_modified"]} if entry else {}
+        error = None
+        failed = None
+        for mirror, location in self.mirrors.candidates(url):
+            local = mirror is not None and is_local_mirror(mirror)
+            if self.offline and not local:
+                continue
+            try:
+                if local:
+                    # A cached copy is as close as a local mirror, so the mirror is only read to fill the cache
+                    if entry is not None or not os.path.isfile(location):
+                        continue
+                    result = self.copy_local(location, body_path, expected_sha1, expected_size, record=False)
+                    validators = {"sha1": expected_sha1}
+                else:
+                    result = self.stream_download(location, body_path, expected_sha1, expected_size, validators, record=False)
+            except Exception as e:
+                if mirror is not None and not local:
+                    import requests
+                    if isinstance(e, (requests.ConnectionError, requests.Timeout)):
+                        self.mirrors.mark_down(mirror)
+                error = e
+                if mirror is not None:
+                    trace.event("mirror_failed", mirror=mirror, url=url, error=str(e))
+                    say("mirror_failed", mirror=mirror, url=url, error=e)
+                continue
+
+            if result[0] == "downloaded":
+                cache.record(url, validators)
+                return result
+            if result[0] == "not_modified":
+                cache.touch(url)
+                return result
+            error = result[0]
+            failed = result
+            if mirror is not None:
+                trace.event("mirror_failed", mirror=mirror, url=url, error=result[0])
+                say("mirror_failed", mirror=mirror, url=url, error=result[0])
+
+        if entry is not None:
+            say("cache_stale", url=url, error=error)
+            return "cached", 0
+        if self.offline:
+            raise OfflineError(text("offline_miss", url=url))
+        if failed is not None and not isinstance(error, Exception):
+            return failed
+        raise error
+
+    # === Download a single file (runs in a worker thread) ===
+    def download_job(self, job):
+        store = self.store if job["sha1"] else None
+        if job.get("buffer"):
+            if store is not None:
+                job["data"] = store.open(job["sha1"])
+                if job["data"] is not None:
+                    return "linked", 0
+            status, written, job["data"] = self.fetch(job["url"], None, job["sha1"], job["size"])
+            if status == "downloaded" and store is not None:
+                store.add_buffer(job["data"], job["sha1"])
+            return status, written
+
+        if job["sha1"] and self.manifest.is_verified(job["local_path"], job["sha1"]):
+            return "valid", 0
+
+        # Files another installation already downloaded are linked from the shared store
+        if store is not None and store.link(job["sha1"], job["local_path"]):
+            self.manifest.record(job["local_path"], job["sha1"])
+            return "linked", 0
+
+        os.makedirs(os.path.dirname(job["local_path"]), exist_ok=True)
+        fetch = self.fetch_cached if job.get("cache") else self.fetch
+        status, written = fetch(job["url"], job["local_path"], job["sha1"], job["size"])
+        if status == "downloaded" and store is not None:
+            store.adopt(job["local_path"], job["sha1"])
+        return status, written
+
+    # === Download a list of files with a bounded worker pool ===
+    def download_all(self, jobs):
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        ready = []
+        if not jobs:
+            return ready
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.download_job, job): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    status, written = future.result()
+                except Exception as e:
+                    trace.event("download_failed", url=job["url"], error=str(e))
+                    say("download_error", url=job["url"], error=e)
+                    continue
+
+                self.add_stats(0 if status in ("valid", "linked", "not_modified", "cached") else 1, written)
+                if status == "linked":
+                    say("store_linked", path=job["path"])
+                    ready.append(job)
+                elif status in ("not_modified", "cached"):
+                    say("cache_hit", path=job["path"])
+                    ready.append(job)
+                elif status == "valid":
+                    if job["kind"] == "native":
+                        say("native_valid", path=job["path"])
+                    elif job["kind"] == "library":
+                        say("library_valid", path=job["path"])
+                    ready.append(job)
+                elif status == "mismatch":
+                    say("sha1_mismatch", path=job["path"])
+                elif status == "size_mismatch":
+                    say("size_mismatch", path=job["path"])
+                else:
+                    say("downloaded", path=job["path"])
+                    ready.append(job)
+        self.add_stats(0, 0, time.perf_counter() - start)
+        self.manifest.save()
+        if self.store is not None:
+            self.store.save()
+        return ready
+
+    # === Download throughput summary ===
+    def print_summary(self):
+        if self.stats["files"]:
+            megabytes = self.stats["bytes"] / (1024 * 1024)
+            seconds = max(self.stats["seconds"], 0.001)
+            say("download_summary", files=self.stats["files"], megabytes=megabytes, seconds=seconds,
+                speed=megabytes / seconds, workers=self.max_workers)
@@ -0,0 +1,70 @@
+import os
+import shutil
+
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# === Function to link a file into place: hardlink, then reflink, then (optionally) a symlink, then a plain copy ===
+FICLONE = 0x40049409
+
+def link_or_copy(source_path, target_path, symlink=False):
+    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+    if os.path.lexists(target_path):
+        os.remove(target_path)
+    try:
+        os.link(source_path, target_path)
+        return
+    except OSError:
+        pass
+    if fcntl is not None:
+        try:
+            with open(source_path, "rb") as src, open(target_path, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            shutil.copystat(source_path, target_path)
+            return
+        except OSError:
+            # The failed clone leaves an empty file behind, which would block the symlink
+            if os.path.lexists(target_path):
+                os.remove(target_path)
+    if symlink:
+        try:
+            os.symlink(os.path.abspath(source_path), target_path)
+            return
+        except OSError:
+            pass
+    shutil.copy2(source_path, target_path)
+
+# === Hold an exclusive lock on a lock file while several processes update the same file ===
+# With blocking=False it yields False instead of waiting when another process holds the lock
+@contextmanager
+def file_lock(lock_path, blocking=True):
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    with open(lock_path, "a+b") as f:
+        try:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            elif msvcrt is not None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        except OSError:
+            if blocking:
+                raise
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
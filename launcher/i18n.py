@@ -0,0 +1,367 @@
+# === Localized messages for the EN and PL front-ends ===
+MESSAGES = {
+    "en": {
+        # Command line
+        "description": "Minecraft Alpha a1.1.1 setup",
+        "help_install": "download, verify and extract everything the game needs (default)",
+        "help_verify": "check the installation without downloading anything",
+        "help_launch": "start the game",
+        "help_repair": "re-hash every file and fetch whatever is missing or corrupt",
+        "help_jobs": "maximum number of parallel downloads (default: 8)",
+        "help_full_verify": "re-hash every file instead of trusting the verification manifest",
+        "help_assets": "asset source: the local asset folder when present, the resources.zip archive or incremental sync from the legacy asset index (default: auto)",
+        "help_dry_run": "only print the install plan, do not change anything",
+        "help_asset_source": "local folder with sound/, newsound/, music/, newmusic/ and streaming/ (default: resources/ next to this script)",
+        "help_merge_jars": "merge the libraries into one launch jar (remembered for later runs)",
+        "help_mirror": "mirror to try before the upstream URLs, laid out as <mirror>/<host>/<path>; may be repeated (added before the mirrors in launcher.json)",
+        "help_trace": "append JSON-lines trace events for this run to FILE",
+        "help_timings": "print a summary of where the time went",
+        "help_profile": "JVM launch profile: default, low-memory, throughput, fast-start or one from launcher.json (remembered for later runs)",
+        "help_store": "share downloaded files between installations through a content-addressed store in DIR (default: minecraft-a1.1.1/store under XDG_CACHE_HOME, ~/.cache or LOCALAPPDATA; remembered for later runs)",
+        "help_no_store": "stop using the shared store",
+        "help_cache_size": "size cap of the HTTP cache for the asset index and resources.zip in MB, 0 to turn it off (default: 512)",
+        "help_offline": "never use the network: only the HTTP cache, the shared store and local mirrors",
+        "help_gc": "remove files from the shared store that no installation uses any more",
+        "help_gc_store": "shared store to clean (default: the one this installation uses)",
+        "help_provision": "install once, then set up COUNT isolated game directories that share the downloaded files",
+        "help_count": "number of instances to set up",
+        "help_player": "player name of each instance, {{n}} is replaced by its number; also names its folder (default: Player{{n}})",
+        "help_into": "folder for the instances (default: instances/ next to this script)",
+        "help_instance": "launch the instance in DIR instead of this installation",
+        "help_no_supervise": "hand over to the JVM (start.bat on Windows) instead of supervising it; no log rotation or start-up timing",
+        "help_stats": "print the start-up times recorded in minecraft/launches.jsonl per host and JVM profile, then exit",
+        "help_verify-assets": "hash the legacy asset folder on every core and compare it with the legacy asset index",
+        "help_workers": "number of hashing processes (default: one per CPU core)",
+        "help_fix": "download the missing or corrupt asset files again",
+        "help_export": "pack the verified installation and its launcher into one offline bundle",
+        "help_export_file": "bundle to write (default: a1.1.1-bundle.tar.gz)",
+        "help_import": "install from a bundle made by export, without using the network",
+        "help_import_file": "bundle to unpack",
+        "help_import_workers": "number of hashing threads (default: one per CPU core)",
+
+        # Downloads
+        "mirror_order": "🌐 Mirrors by latency: {mirrors}",
+        "mirror_down": "⚠️ Mirror {mirror} is not reachable - skipping it for this run.",
+        "mirror_failed": "⚠️ {mirror} could not provide {url} ({error}) - trying the next source...",
+        "cache_hit": "♻️ Served from the HTTP cache: {path}",
+        "cache_stale": "⚠️ Could not revalidate {url} ({error}) - using the cached copy.",
+        "offline_miss": "offline mode: {url} is not in the cache, the shared store or a local mirror",
+        "store_linked": "🔗 Linked from the shared store: {path}",
+        "store_synced": "📦 Shared store {path}: {added} files added, {linked} duplicates linked.",
+        "store_gc_start": "🧹 Cleaning the shared store {path}...",
+        "store_gc_dropped": "🗑️ Installation no longer exists, dropping its references: {path}",
+        "store_gc_done": "✅ Removed {removed} unused files ({megabytes:.2f} MB), kept {kept} files that are still referenced or hardlinked ({instances} installations).",
+        "download_error": "❌ Error downloading {url}: {error}",
+        "native_valid": "✅ Native library already exists and is valid: {path}",
+        "library_valid": "✅ Library already exists and is valid: {path}",
+        "sha1_mismatch": "❌ Error: SHA1 mismatch for {path}!",
+        "size_mismatch": "❌ Error: Size mismatch for {path}!",
+        "downloaded": "✅ Downloaded: {path}",
+        "download_summary": "\n📊 Downloaded {files} files ({megabytes:.2f} MB) in {seconds:.2f}s - {speed:.2f} MB/s with {workers} workers",
+
+        # Java
+        "java_found_cached": "✅ Found Java 8 at: {path} (cached)",
+        "java_found": "✅ Found Java 8 at: {path}",
+        "java_not_found_cached": "⚠️ Java 8 not found (nothing changed since the last search).",
+        "java_not_found": "❌ Java 8 not found! Download JDK or JRE 8 from https://adoptopenjdk.net or https://www.oracle.com/java/",
+
+        # Assets
+        "assets_downloading": "📥 Downloading asset resources...\n",
+        "assets_zip_exists": "✅ Resource file already exists: {path}",
+        "assets_extracting": "📦 Extracting resources to {path}",
+        "assets_extracted": "✅ Extracted resources ({extracted} updated, {skipped} unchanged)",
+        "deleted_temp_file": "🗑️ Deleted temporary file: {path}",
+        "assets_error": "❌ Error downloading or extracting assets: {error}",
+        "assets_manual_download": "⚠️ Manually download resources from https://minecraft.wiki/w/Resources or https://archive.org/download/minecraft-resources",
+        "assets_manual_extract": "⚠️ Extract to minecraft/assets/virtual/legacy/ (e.g., sound/, music/, textures/)",
+        "assets_local_linked": "✅ Linked {linked} of {present} files from the local asset source {source}",
+        "assets_local_copying": "📥 Copying asset resources from the local asset source...\n",
+        "assets_index_syncing": "📥 Syncing assets from the {index} asset index...\n",
+        "assets_index_downloaded": "✅ Downloaded asset index: {index}",
+        "assets_index_error": "❌ Error downloading asset index: {error}",
+        "assets_local_seeded": "✅ Took {seeded} asset objects from the local asset source {source}",
+        "assets_objects_present": "✅ {ready}/{total} asset objects present in {path}",
+        "assets_virtual_updated": "✅ Updated {linked} files in {path}",
+        "verify_assets_start": "🔍 Hashing {files} asset files in {path} with {workers} workers...",
+        "verify_assets_progress": "   {done}/{total} files, {megabytes:.2f} MB ({speed:.2f} MB/s)",
+        "verify_assets_done": "📊 Hashed {files} files ({megabytes:.2f} MB) in {seconds:.2f}s - {speed:.2f} MB/s, {rate:.0f} files/s",
+        "verify_assets_ok": "✅ Every asset file matches the asset index.",
+        "verify_assets_mismatches": "\n❌ {count} asset files do not match the asset index:",
+        "verify_assets_missing": "missing",
+        "verify_assets_size": "size",
+        "verify_assets_sha1": "sha1",
+        "verify_assets_hint": "Run verify-assets --fix to download them again.",
+        "verify_assets_fixed": "✅ Downloaded {fixed} of {count} asset files again.",
+
+        # Install
+        "json_error": "❌ Error loading JSON: {error}",
+        "no_native": "⚠️ No {classifier} native library in {name}",
+        "nothing_to_do": "✅ Everything is up to date - nothing to do.",
+        "plan_header": "\n📋 Install plan:",
+        "libraries_downloading": "📥 Downloading libraries...\n",
+        "natives_downloading": "\n📥 Downloading native libraries...\n",
+        "natives_arch": "🧩 Extracting only the {arch}-bit native libraries for {system}, to match {java}.",
+        "extracting": "📦 Extracting: {path} to {target}",
+        "extracted": "✅ Extracted: {path} ({extracted} updated, {skipped} unchanged)",
+        "extract_error": "❌ Error extracting {path}: {error}",
+        "deleted_temp_folder": "🗑️ Deleted temporary folder: {path}",
+        "deleted_folder": "🗑️ Deleted folder: {path}",
+        "jar_moved": "📦 Moved JAR file to main directory: {path}",
+        "merge_jars_building": "\n📦 Merging {jars} libraries into {path}...",
+        "merge_jars_done": "✅ Merged launch jar: {entries} entries, {dropped} duplicate or META-INF entries dropped",
+        "merge_jars_error": "❌ Error merging libraries: {error}",
+        "unknown_profile": "❌ Unknown launch profile: {profile} (available: {profiles})",
+        "cds_generating": "\n📦 Generating the class-data-sharing archive {path}...",
+        "cds_generated": "✅ Generated the class-data-sharing archive ({megabytes:.1f} MB)",
+        "cds_unsupported": "⚠️ {java} cannot create or use a class-data-sharing archive with the {profile} profile - launching without one.",
+        "bat_generating": "\n📝 Generating start.bat...\n",
+        "bat_without_java": "⚠️ Generating start.bat without Java path - set JAVA_HOME or install Java 8.",
+        "bat_generated": "✅ Generated start.bat! 🔥",
+        "launch_manifest_written": "✅ Wrote the launch manifest: {path}",
+        "install_done": "\n✅ All libraries, native libraries, assets downloaded, and start.bat ready! 🚀",
+        "install_failed": "\n❌ {count} downloads or extractions failed - see the errors above and run install again.",
+        "provision_start": "\n👥 Setting up {count} instances in {path}...",
+        "provision_instance_done": "✅ {player}: {path} ready ({linked} files linked).",
+        "provision_error": "❌ Could not set up {path}: {error}",
+        "provision_done": "\n✅ {count} instances ready in {path}! 🚀",
+        "provision_bad_names": "❌ The player name pattern {pattern} must give {count} different names of 1-16 letters, digits or _ (use {{n}} for the number).",
+
+        # Verify, repair and launch
+        "verify_ok": "✅ Installation is complete and valid.",
+        "timings_header": "\n⏱️ Where the time went ({seconds:.3f}s wall time, nested phases overlap):",
+        "timings_counters": "📊 Downloaded {downloaded:.2f} MB in {files} files, hashed {hashed:.2f} MB in {hashed_files} files, extracted {extracted} files.",
+        "timings_slowest": "🐢 Slowest downloads:",
+        "verify_problems": "\n❌ The installation needs these actions (run install or repair):",
+        "repair_start": "🔧 Re-hashing every file and repairing the installation...\n",
+        "launch_missing_bat": "❌ start.bat not found - run install first.",
+        "launch_missing_manifest": "❌ {path} not found - run install first.",
+        "launch_unsupported_os": "❌ No native libraries for {system} in a1.1.1.json.",
+        "launch_starting": "🚀 Launching Minecraft Alpha a1.1.1 with {java}...",
+        "launch_supervised": "📝 Game running (PID {pid}), output goes to {path}",
+        "launch_ready": "✅ LWJGL is up after {seconds:.2f} s",
+        "launch_exited": "👋 The game closed normally after {seconds:.1f} s.",
+        "launch_crashed": "💥 The game crashed with exit code {code} after {seconds:.1f} s - see {path}",
+        "launch_crash_line": "   {line}",
+        "launch_never_ready": "⚠️ LWJGL never came up - the crash happened during start-up.",
+        "launch_stats_empty": "ℹ️ No supervised launches recorded in {path} yet.",
+        "launch_stats_header": "⏱️ Start-up time until LWJGL is up, per host and JVM profile:",
+        "launch_stats_row": "   {host} / {profile}: {launches} launches, {crashes} crashed, median {median:.2f} s (fastest {fastest:.2f} s, slowest {slowest:.2f} s)",
+        "launch_stats_row_no_ready": "   {host} / {profile}: {launches} launches, {crashes} crashed, LWJGL never came up",
+        "export_not_installed": "❌ The installation is not complete - run install first. Still to do:",
+        "export_start": "📦 Packing {files} files into {path}...",
+        "export_done": "✅ Wrote {path}: {files} files as {objects} distinct objects, {megabytes:.1f} MB ({saved:.1f} MB of duplicates left out)",
+        "import_start": "📦 Unpacking {files} files ({objects} distinct objects) from {path}...",
+        "import_bad_bundle": "❌ {path} is not a bundle made by export.",
+        "import_wrong_bundle": "❌ {path} holds version {version}, but a1.1.1.json is {expected}.",
+        "import_error": "❌ Could not read {path}: {error}",
+        "import_unsafe_path": "❌ {path} tries to write {file}, which export never packs - nothing was unpacked.",
+        "import_corrupt": "❌ Object {sha1} ({path}) is missing from the bundle or does not match its SHA1.",
+        "import_failed": "❌ {count} objects failed verification - the files they would have replaced were left as they were.",
+        "import_done": "✅ Unpacked and verified {files} files ({objects} objects, {megabytes:.1f} MB) in {seconds:.1f} s",
+        "import_incomplete": "⚠️ The bundle does not cover everything this machine needs - run install to fetch the rest:",
+        "import_ready": "✅ The installation is ready to launch.",
+
+        # start.bat comments
+        "bat_game_filename": ":: === Game filename ===",
+        "bat_main_class": ":: === Main launcher class ===",
+        "bat_arguments": ":: === Launcher arguments ===",
+        "bat_jvm_arguments": ":: === JVM arguments from the launch profile ===",
+        "bat_library_dir": ":: === Library directory path ===",
+        "bat_natives_dir": ":: === Native library directory path ===",
+        "bat_assets_dir": ":: === Create assets folder if it doesn't exist ===",
+        "bat_classpath": ":: === Classpath resolved at install time from a1.1.1.json ===",
+        "bat_game_jar_last": ":: Add minecraft.jar at the end",
+        "bat_launch": ":: === Launch game ===",
+        "bat_launching": "echo 🚀 Launching Minecraft Alpha a1.1.1... > log.log",
+    },
+    "pl": {
+        # Wiersz poleceń
+        "description": "Instalator Minecraft Alpha a1.1.1",
+        "help_install": "pobierz, sprawdź i rozpakuj wszystko, czego potrzebuje gra (domyślnie)",
+        "help_verify": "sprawdź instalację bez pobierania czegokolwiek",
+        "help_launch": "uruchom grę",
+        "help_repair": "ponownie policz sumy wszystkich plików i pobierz brakujące lub uszkodzone",
+        "help_jobs": "maksymalna liczba równoległych pobrań (domyślnie: 8)",
+        "help_full_verify": "ponownie licz sumy SHA1 wszystkich plików zamiast ufać manifestowi weryfikacji",
+        "help_assets": "źródło assetów: lokalny folder z zasobami (jeśli istnieje), archiwum resources.zip lub przyrostowa synchronizacja z indeksu assetów legacy (domyślnie: auto)",
+        "help_dry_run": "tylko wypisz plan instalacji, niczego nie zmieniaj",
+        "help_asset_source": "lokalny folder z sound/, newsound/, music/, newmusic/ i streaming/ (domyślnie: resources/ obok tego skryptu)",
+        "help_merge_jars": "scal biblioteki w jeden plik jar do uruchamiania (zapamiętywane dla kolejnych uruchomień)",
+        "help_mirror": "serwer lustrzany sprawdzany przed oryginalnymi adresami, w układzie <mirror>/<host>/<ścieżka>; można podać wiele razy (przed serwerami z launcher.json)",
+        "help_trace": "dopisz zdarzenia śledzenia tego uruchomienia (JSON lines) do pliku FILE",
+        "help_timings": "wypisz podsumowanie, na co poszedł czas",
+        "help_profile": "profil uruchamiania JVM: default, low-memory, throughput, fast-start lub profil z launcher.json (zapamiętywany dla kolejnych uruchomień)",
+        "help_store": "współdziel pobrane pliki między instalacjami przez magazyn adresowany treścią w DIR (domyślnie: minecraft-a1.1.1/store w XDG_CACHE_HOME, ~/.cache lub LOCALAPPDATA; zapamiętywany dla kolejnych uruchomień)",
+        "help_no_store": "przestań używać wspólnego magazynu",
+        "help_cache_size": "limit pamięci podręcznej HTTP na indeks assetów i resources.zip w MB, 0 wyłącza ją (domyślnie: 512)",
+        "help_offline": "nie używaj sieci: tylko pamięć podręczna HTTP, wspólny magazyn i lokalne serwery lustrzane",
+        "help_gc": "usuń ze wspólnego magazynu pliki, których nie używa już żadna instalacja",
+        "help_gc_store": "wspólny magazyn do wyczyszczenia (domyślnie: ten, którego używa ta instalacja)",
+        "help_provision": "zainstaluj raz, a potem przygotuj COUNT odizolowanych katalogów gry, które współdzielą pobrane pliki",
+        "help_count": "liczba instancji do przygotowania",
+        "help_player": "nazwa gracza każdej instancji, {{n}} zastępowane jest jej numerem; to także nazwa jej folderu (domyślnie: Player{{n}})",
+        "help_into": "folder na instancje (domyślnie: instances/ obok tego skryptu)",
+        "help_instance": "uruchom instancję z DIR zamiast tej instalacji",
+        "help_no_supervise": "oddaj sterowanie JVM (start.bat w Windows) zamiast ją nadzorować; bez rotacji logów i pomiaru czasu startu",
+        "help_stats": "wypisz czasy startu zapisane w minecraft/launches.jsonl dla każdego hosta i profilu JVM, po czym zakończ",
+        "help_verify-assets": "policz sumy folderu assetów legacy na wszystkich rdzeniach i porównaj je z indeksem assetów legacy",
+        "help_workers": "liczba procesów liczących sumy (domyślnie: jeden na rdzeń procesora)",
+        "help_fix": "pobierz ponownie brakujące lub uszkodzone pliki assetów",
+        "help_export": "spakuj zweryfikowaną instalację i jej launcher do jednej paczki offline",
+        "help_export_file": "paczka do zapisania (domyślnie: a1.1.1-bundle.tar.gz)",
+        "help_import": "zainstaluj z paczki utworzonej przez export, bez użycia sieci",
+        "help_import_file": "paczka do rozpakowania",
+        "help_import_workers": "liczba wątków liczących sumy (domyślnie: jeden na rdzeń procesora)",
+
+        # Pobieranie
+        "mirror_order": "🌐 Serwery lustrzane według opóźnienia: {mirrors}",
+        "mirror_down": "⚠️ Serwer lustrzany {mirror} jest nieosiągalny - pomijam go w tym uruchomieniu.",
+        "mirror_failed": "⚠️ {mirror} nie dostarczył {url} ({error}) - próbuję następnego źródła...",
+        "cache_hit": "♻️ Z pamięci podręcznej HTTP: {path}",
+        "cache_stale": "⚠️ Nie udało się sprawdzić aktualności {url} ({error}) - używam kopii z pamięci podręcznej.",
+        "offline_miss": "tryb offline: {url} nie ma w pamięci podręcznej, wspólnym magazynie ani lokalnym serwerze lustrzanym",
+        "store_linked": "🔗 Podlinkowano ze wspólnego magazynu: {path}",
+        "store_synced": "📦 Wspólny magazyn {path}: dodano {added} plików, podlinkowano {linked} duplikatów.",
+        "store_gc_start": "🧹 Czyszczenie wspólnego magazynu {path}...",
+        "store_gc_dropped": "🗑️ Instalacja już nie istnieje, usuwam jej odwołania: {path}",
+        "store_gc_done": "✅ Usunięto {removed} nieużywanych plików ({megabytes:.2f} MB), zachowano {kept} plików, które są nadal używane lub podlinkowane (instalacje: {instances}).",
+        "download_error": "❌ Błąd przy pobieraniu {url}: {error}",
+        "native_valid": "✅ Natywna biblioteka już istnieje i jest poprawna: {path}",
+        "library_valid": "✅ Biblioteka już istnieje i jest poprawna: {path}",
+        "sha1_mismatch": "❌ Błąd: Suma SHA1 dla {path} się nie zgadza!",
+        "size_mismatch": "❌ Błąd: Rozmiar pliku {path} się nie zgadza!",
+        "downloaded": "✅ Pobrano: {path}",
+        "download_summary": "\n📊 Pobrano {files} plików ({megabytes:.2f} MB) w {seconds:.2f}s - {speed:.2f} MB/s przy {workers} wątkach",
+
+        # Java
+        "java_found_cached": "✅ Znaleziono Java 8 w: {path} (z pamięci podręcznej)",
+        "java_found": "✅ Znaleziono Java 8 w: {path}",
+        "java_not_found_cached": "⚠️ Nie znaleziono Java 8 (nic się nie zmieniło od ostatniego wyszukiwania).",
+        "java_not_found": "❌ Nie znaleziono Java 8! Pobierz JDK lub JRE 8 z https://adoptopenjdk.net lub https://www.oracle.com/java/",
+
+        # Assety
+        "assets_downloading": "📥 Pobieranie zasobów assetów...\n",
+        "assets_zip_exists": "✅ Plik zasobów już istnieje: {path}",
+        "assets_extracting": "📦 Rozpakowywanie zasobów do {path}",
+        "assets_extracted": "✅ Rozpakowano zasoby ({extracted} zaktualizowanych, {skipped} bez zmian)",
+        "deleted_temp_file": "🗑️ Usunięto tymczasowy plik: {path}",
+        "assets_error": "❌ Błąd przy pobieraniu lub rozpakowywaniu assetów: {error}",
+        "assets_manual_download": "⚠️ Ręcznie pobierz zasoby z https://minecraft.wiki/w/Resources lub https://archive.org/download/minecraft-resources",
+        "assets_manual_extract": "⚠️ Rozpakuj do minecraft/assets/virtual/legacy/ (np. sound/, music/, textures/)",
+        "assets_local_linked": "✅ Podlinkowano {linked} z {present} plików z lokalnego źródła assetów {source}",
+        "assets_local_copying": "📥 Kopiowanie zasobów assetów z lokalnego źródła assetów...\n",
+        "assets_index_syncing": "📥 Synchronizacja assetów z indeksu {index}...\n",
+        "assets_index_downloaded": "✅ Pobrano indeks assetów: {index}",
+        "assets_index_error": "❌ Błąd przy pobieraniu indeksu assetów: {error}",
+        "assets_local_seeded": "✅ Wzięto {seeded} obiektów assetów z lokalnego źródła assetów {source}",
+        "assets_objects_present": "✅ {ready}/{total} obiektów assetów w {path}",
+        "assets_virtual_updated": "✅ Zaktualizowano {linked} plików w {path}",
+        "verify_assets_start": "🔍 Liczenie sum {files} plików assetów w {path} przez {workers} procesów...",
+        "verify_assets_progress": "   {done}/{total} plików, {megabytes:.2f} MB ({speed:.2f} MB/s)",
+        "verify_assets_done": "📊 Policzono sumy {files} plików ({megabytes:.2f} MB) w {seconds:.2f}s - {speed:.2f} MB/s, {rate:.0f} plików/s",
+        "verify_assets_ok": "✅ Wszystkie pliki assetów zgadzają się z indeksem assetów.",
+        "verify_assets_mismatches": "\n❌ Plików assetów niezgodnych z indeksem: {count}",
+        "verify_assets_missing": "brak",
+        "verify_assets_size": "rozmiar",
+        "verify_assets_sha1": "sha1",
+        "verify_assets_hint": "Uruchom verify-assets --fix, aby pobrać je ponownie.",
+        "verify_assets_fixed": "✅ Pobrano ponownie {fixed} z {count} plików assetów.",
+
+        # Instalacja
+        "json_error": "❌ Błąd wczytywania JSON: {error}",
+        "no_native": "⚠️ Brak natywnej biblioteki {classifier} w {name}",
+        "nothing_to_do": "✅ Wszystko jest aktualne - nie ma nic do zrobienia.",
+        "plan_header": "\n📋 Plan instalacji:",
+        "libraries_downloading": "📥 Pobieranie bibliotek...\n",
+        "natives_downloading": "\n📥 Pobieranie natywnych bibliotek...\n",
+        "natives_arch": "🧩 Rozpakowywanie tylko {arch}-bitowych natywnych bibliotek dla {system}, zgodnie z {java}.",
+        "extracting": "📦 Rozpakowywanie: {path} do {target}",
+        "extracted": "✅ Rozpakowano: {path} ({extracted} zaktualizowanych, {skipped} bez zmian)",
+        "extract_error": "❌ Błąd przy rozpakowywaniu {path}: {error}",
+        "deleted_temp_folder": "🗑️ Usunięto folder tymczasowy: {path}",
+        "deleted_folder": "🗑️ Usunięto folder: {path}",
+        "jar_moved": "📦 Przeniesiono plik JAR do głównego folderu: {path}",
+        "merge_jars_building": "\n📦 Scalanie {jars} bibliotek w {path}...",
+        "merge_jars_done": "✅ Scalony jar do uruchamiania: {entries} wpisów, pominięto {dropped} duplikatów lub wpisów META-INF",
+        "merge_jars_error": "❌ Błąd scalania bibliotek: {error}",
+        "unknown_profile": "❌ Nieznany profil uruchamiania: {profile} (dostępne: {profiles})",
+        "cds_generating": "\n📦 Generowanie archiwum współdzielenia klas {path}...",
+        "cds_generated": "✅ Wygenerowano archiwum współdzielenia klas ({megabytes:.1f} MB)",
+        "cds_unsupported": "⚠️ {java} nie potrafi utworzyć ani użyć archiwum współdzielenia klas z profilem {profile} - uruchamianie bez niego.",
+        "bat_generating": "\n📝 Generowanie start.bat...\n",
+        "bat_without_java": "⚠️ Generowanie start.bat bez wskazania Javy – ustaw JAVA_HOME lub zainstaluj Java 8.",
+        "bat_generated": "✅ Wygenerowano start.bat! 🔥",
+        "launch_manifest_written": "✅ Zapisano manifest uruchamiania: {path}",
+        "install_done": "\n✅ Wszystkie biblioteki, natywne biblioteki, assety pobrane, a start.bat gotowy! 🚀",
+        "install_failed": "\n❌ Nie powiodło się {count} pobrań lub rozpakowań - zobacz błędy powyżej i uruchom install ponownie.",
+        "provision_start": "\n👥 Przygotowywanie {count} instancji w {path}...",
+        "provision_instance_done": "✅ {player}: {path} gotowa (podlinkowano {linked} plików).",
+        "provision_error": "❌ Nie udało się przygotować {path}: {error}",
+        "provision_done": "\n✅ Instancje gotowe w {path}: {count}! 🚀",
+        "provision_bad_names": "❌ Wzorzec nazwy gracza {pattern} musi dać {count} różnych nazw z 1-16 liter, cyfr lub _ (użyj {{n}} jako numeru).",
+
+        # Weryfikacja, naprawa i uruchamianie
+        "verify_ok": "✅ Instalacja jest kompletna i poprawna.",
+        "timings_header": "\n⏱️ Na co poszedł czas ({seconds:.3f}s łącznie, zagnieżdżone fazy się nakładają):",
+        "timings_counters": "📊 Pobrano {downloaded:.2f} MB w {files} plikach, policzono sumy {hashed:.2f} MB w {hashed_files} plikach, rozpakowano {extracted} plików.",
+        "timings_slowest": "🐢 Najwolniejsze pobrania:",
+        "verify_problems": "\n❌ Instalacja wymaga tych działań (uruchom install lub repair):",
+        "repair_start": "🔧 Ponowne liczenie sum wszystkich plików i naprawa instalacji...\n",
+        "launch_missing_bat": "❌ Nie znaleziono start.bat - najpierw uruchom install.",
+        "launch_missing_manifest": "❌ Nie znaleziono {path} - najpierw uruchom install.",
+        "launch_unsupported_os": "❌ Brak natywnych bibliotek dla {system} w a1.1.1.json.",
+        "launch_starting": "🚀 Uruchamianie Minecraft Alpha a1.1.1 przez {java}...",
+        "launch_supervised": "📝 Gra działa (PID {pid}), jej wyjście trafia do {path}",
+        "launch_ready": "✅ LWJGL wystartował po {seconds:.2f} s",
+        "launch_exited": "👋 Gra zamknęła się normalnie po {seconds:.1f} s.",
+        "launch_crashed": "💥 Gra uległa awarii z kodem wyjścia {code} po {seconds:.1f} s - zobacz {path}",
+        "launch_crash_line": "   {line}",
+        "launch_never_ready": "⚠️ LWJGL nie wystartował - awaria nastąpiła podczas uruchamiania.",
+        "launch_stats_empty": "ℹ️ W {path} nie zapisano jeszcze żadnych nadzorowanych uruchomień.",
+        "launch_stats_header": "⏱️ Czas startu do uruchomienia LWJGL dla każdego hosta i profilu JVM:",
+        "launch_stats_row": "   {host} / {profile}: uruchomień: {launches}, awarii: {crashes}, mediana {median:.2f} s (najszybciej {fastest:.2f} s, najwolniej {slowest:.2f} s)",
+        "launch_stats_row_no_ready": "   {host} / {profile}: uruchomień: {launches}, awarii: {crashes}, LWJGL nie wystartował",
+        "export_not_installed": "❌ Instalacja nie jest kompletna - najpierw uruchom install. Pozostało:",
+        "export_start": "📦 Pakowanie {files} plików do {path}...",
+        "export_done": "✅ Zapisano {path}: {files} plików jako {objects} różnych obiektów, {megabytes:.1f} MB (pominięto {saved:.1f} MB duplikatów)",
+        "import_start": "📦 Rozpakowywanie {files} plików ({objects} różnych obiektów) z {path}...",
+        "import_bad_bundle": "❌ {path} nie jest paczką utworzoną przez export.",
+        "import_wrong_bundle": "❌ {path} zawiera wersję {version}, a a1.1.1.json to {expected}.",
+        "import_error": "❌ Nie można odczytać {path}: {error}",
+        "import_unsafe_path": "❌ {path} próbuje zapisać {file}, którego export nigdy nie pakuje - niczego nie rozpakowano.",
+        "import_corrupt": "❌ Obiektu {sha1} ({path}) brakuje w paczce lub nie zgadza się jego SHA1.",
+        "import_failed": "❌ {count} obiektów nie przeszło weryfikacji - pliki, które miały zastąpić, pozostały bez zmian.",
+        "import_done": "✅ Rozpakowano i zweryfikowano {files} plików ({objects} obiektów, {megabytes:.1f} MB) w {seconds:.1f} s",
+        "import_incomplete": "⚠️ Paczka nie zawiera wszystkiego, czego potrzebuje ten komputer - uruchom install, aby pobrać resztę:",
+        "import_ready": "✅ Instalacja jest gotowa do uruchomienia.",
+
+        # Komentarze w start.bat
+        "bat_game_filename": ":: === Nazwa pliku gry ===",
+        "bat_main_class": ":: === Główna klasa launchera ===",
+        "bat_arguments": ":: === Argumenty launchera ===",
+        "bat_jvm_arguments": ":: === Argumenty JVM z profilu uruchamiania ===",
+        "bat_library_dir": ":: === Ścieżka do katalogu z bibliotekami ===",
+        "bat_natives_dir": ":: === Ścieżka do katalogu z natywnymi bibliotekami ===",
+        "bat_assets_dir": ":: === Tworzenie folderu assets, jeśli nie istnieje ===",
+        "bat_classpath": ":: === Classpath ustalony podczas instalacji z a1.1.1.json ===",
+        "bat_game_jar_last": ":: Dodajemy minecraft.jar na koniec",
+        "bat_launch": ":: === Uruchamianie gry ===",
+        "bat_launching": "echo 🚀 Uruchamianie Minecraft Alpha a1.1.1... > log.log",
+    },
+}
+
+language = "en"
+
+# === Function to choose the message language ===
+def set_language(name):
+    global language
+    language = name if name in MESSAGES else "en"
+
+# === Function to look up and format a message ===
+def text(key, **values):
+    message = MESSAGES[language].get(key, MESSAGES["en"][key])
+    return message.format(**values)
+
+# === Function to print a message ===
+def say(key, **values):
+    print(text(key, **values))
@@ -0,0 +1,464 @@
+import os
+import json
+import shutil
+import hashlib
+
+from launcher import assets, trace
+from launcher.archive import extract_zip, merge_jars
+from launcher.cache import DEFAULT_CACHE_MB, HttpCache, default_cache_folder
+from launcher.download import Downloader
+from launcher.i18n import say
+from launcher.java import find_java_8, java_arch
+from launcher.launch import BAT_NATIVES, build_launch_manifest, build_library_classpath, build_start_bat, cds_arguments, load_profiles
+from launcher.layout import host_arch, host_os
+from launcher.mirrors import MirrorList, is_local_mirror
+from launcher.state import VerifyManifest, files_present, load_json, save_json
+from launcher.store import Store, store_folder
+
+# === One installation of a1.1.1: its layout, state files and download engine ===
+class Installer:
+    def __init__(self, layout, jobs=8, full_verify=False, asset_mode="auto", asset_source=None, merge_jars=None,
+                 profile=None, mirrors=(), store=None, cache_size=None, offline=False, dry_run=False):
+        self.layout = layout
+        self.asset_mode = asset_mode
+        self.local_assets_folder = asset_source or os.path.join(layout.main_dir, "resources")
+        # A dry run only reads: folders are created by execute() and the Java lookup is not remembered
+        self.dry_run = dry_run
+
+        with open(layout.json_path, "r") as f:
+            self.version_data = json.load(f)
+
+        self.manifest = VerifyManifest(layout.manifest_path, layout.minecraft_dir, full_verify)
+        self.install_state = load_json(layout.install_state_path)
+        config = load_json(layout.config_path)
+
+        # Shared store: command line, then launcher.json, then the last one used (off unless chosen)
+        self.store_folder = store_folder(store, config, self.install_state)
+        self.store = Store(self.store_folder) if self.store_folder else None
+
+        # HTTP cache for the asset index and resources.zip, capped in MB (0 turns it off)
+        cache_size = config.get("cache_size", DEFAULT_CACHE_MB) if cache_size is None else cache_size
+        cache = HttpCache(default_cache_folder(), cache_size * 1024 * 1024) if cache_size > 0 else None
+
+        # Mirrors from the command line come before the ones in launcher.json; offline only local ones are used
+        mirrors = list(mirrors) + config.get("mirrors", [])
+        if offline:
+            mirrors = [mirror for mirror in mirrors if is_local_mirror(mirror)]
+        self.downloader = Downloader(self.manifest, jobs, MirrorList(mirrors), self.store, cache, offline)
+
+        # Merging the libraries into one launch jar is opt-in and remembered once chosen
+        self.merge_jars = self.install_state.get("merge_jars", False) if merge_jars is None else merge_jars
+
+        # Launch profile: command line, then launcher.json, then the last one used
+        self.profiles = load_profiles(config)
+        remembered = self.install_state.get("profile")
+        if remembered not in self.profiles:
+            remembered = None
+        self.profile = profile or config.get("profile") or remembered or "default"
+        self._java_bin = False
+        self._java_arch = False
+
+        # start.bat always needs the Windows natives; other systems also get their own for the direct launch
+        self.native_os_list = ["windows"]
+        if host_os() and host_os() != "windows":
+            self.native_os_list.append(host_os())
+        self.library_jobs = self.build_library_jobs()
+        self.native_jobs = self.build_native_jobs()
+
+    def save_install_state(self):
+        save_json(self.layout.install_state_path, self.install_state)
+
+    # === Library jobs ===
+    def build_library_jobs(self):
+        library_jobs = []
+        for lib in self.version_data["libraries"]:
+            if "downloads" in lib and "artifact" in lib["downloads"]:
+                artifact = lib["downloads"]["artifact"]
+                url = artifact["url"]
+                path = artifact.get("path", url.split("/")[-1])
+                library_jobs.append({
+                    "url": url,
+                    "path": path,
+                    "local_path": os.path.join(self.layout.libraries_folder, path),
+                    "sha1": artifact.get("sha1"),
+                    "size": artifact.get("size"),
+                    "kind": "library",
+                })
+        return library_jobs
+
+    # === Native library jobs, one per library and operating system ===
+    def build_native_jobs(self):
+        native_jobs = []
+        for os_name in self.native_os_list:
+            for lib in self.version_data["libraries"]:
+                if "natives" in lib and os_name in lib["natives"]:
+                    classifier = lib["natives"][os_name].replace("${arch}", self.java_arch() or host_arch())
+                    native_data = lib["downloads"].get("classifiers", {}).get(classifier)
+                    if not native_data:
+                        say("no_native", classifier=classifier, name=lib["name"])
+                        continue
+
+                    url = native_data["url"]
+                    path = native_data.get("path", url.split("/")[-1])
+
+                    # Natives for this system only keep the members for the detected JVM's architecture, so their cache
+                    # key includes it; without a JVM (or for start.bat on another system) both twins are extracted
+                    arch = self.java_arch() if os_name == host_os() else None
+                    native_jobs.append({
+                        "url": url,
+                        "path": path,
+                        "sha1": native_data.get("sha1"),
+                        "size": native_data.get("size"),
+                        "kind": "native",
+                        "buffer": True,
+                        "exclude": lib.get("extract", {}).get("exclude", []),
+                        "target_folder": self.layout.natives_folder_for(os_name),
+                        "arch": arch,
+                        "cache_key": f"{native_data.get('sha1')}-{arch}" if arch else native_data.get("sha1"),
+                    })
+        return native_jobs
+
+    # === Java 8 used for start.bat and the class-data-sharing archive (looked up once per run) ===
+    def java_bin(self):
+        if self._java_bin is False:
+            with trace.phase("java"):
+                self._java_bin = find_java_8(self.layout.java_cache_path, save_cache=not self.dry_run)
+        return self._java_bin
+
+    # === Pointer size of that Java 8, which decides the natives it can load (None when there is no JVM) ===
+    def java_arch(self):
+        if self._java_arch is False:
+            java_bin = self.java_bin()
+            self._java_arch = java_arch(java_bin) if java_bin else None
+        return self._java_arch
+
+    # === Class-data-sharing archive, keyed by the java binary and the profile flags it was dumped with ===
+    def cds_current(self):
+        recorded = self.install_state.get("cds")
+        java_bin = self.java_bin()
+        try:
+            return (recorded is not None and recorded["java"] == java_bin
+                    and recorded["mtime_ns"] == os.stat(java_bin).st_mtime_ns
+                    and recorded.get("jvm_arguments") == self.profiles[self.profile]
+                    and (recorded["unsupported"] or os.path.getsize(self.layout.cds_archive) == recorded["size"]))
+        except (OSError, TypeError):
+            return False
+
+    def build_cds_archive(self):
+        import subprocess
+
+        layout = self.layout
+        java_bin = self.java_bin()
+        profile_arguments = list(self.profiles[self.profile])
+        say("cds_generating", path=layout.cds_archive)
+        try:
+            # The heap and GC flags must match the launch, or -Xshare:auto drops the archive without a word
+            with trace.phase("cds"):
+                result = subprocess.run([java_bin] + profile_arguments + ["-XX:+UnlockDiagnosticVMOptions", f"-XX:SharedArchiveFile={layout.cds_archive}", "-Xshare:dump"],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=300)
+                unsupported = result.returncode != 0 or not os.path.isfile(layout.cds_archive)
+
+                # Checked once with the launch flags; -Xshare:on fails where the launch would silently skip it
+                if not unsupported:
+                    result = subprocess.run([java_bin] + profile_arguments + cds_arguments(layout.cds_archive, "on") + ["-version"],
+                                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60)
+                    unsupported = result.returncode != 0
+        except (OSError, subprocess.TimeoutExpired):
+            unsupported = True
+
+        self.install_state["cds"] = {
+            "java": java_bin,
+            "mtime_ns": os.stat(java_bin).st_mtime_ns,
+            "jvm_arguments": profile_arguments,
+            "unsupported": unsupported,
+            "size": None if unsupported else os.path.getsize(layout.cds_archive),
+        }
+        self.save_install_state()
+        if unsupported:
+            say("cds_unsupported", java=java_bin, profile=self.profile)
+        else:
+            say("cds_generated", megabytes=self.install_state["cds"]["size"] / (1024 * 1024))
+
+    # === JVM arguments: the launch profile plus the class-data-sharing archive when there is one ===
+    def jvm_arguments(self):
+        jvm_arguments = list(self.profiles[self.profile])
+        if self.java_bin() and self.cds_current() and not self.install_state["cds"]["unsupported"]:
+            jvm_arguments += cds_arguments(os.path.relpath(self.layout.cds_archive, self.layout.main_dir).replace(os.sep, "/"))
+        return jvm_arguments
+
+    # === Classpath, natives and arguments for launching without start.bat ===
+    def launch_manifest(self):
+        return build_launch_manifest(self.version_data, self.layout, self.native_os_list, self.merge_jars,
+                                     self.jvm_arguments())
+
+    def start_bat(self):
+        return build_start_bat(self.version_data, self.java_bin(), self.merge_jars, self.jvm_arguments())
+
+    # === Key of the merged launch jar: the SHA1s of its input jars in classpath order ===
+    def merged_jar_inputs(self):
+        library_sha1 = {job["path"]: job["sha1"] for job in self.library_jobs}
+        paths = build_library_classpath(self.version_data)
+        key = hashlib.sha1("\n".join(f"{path} {library_sha1.get(path)}" for path in paths).encode()).hexdigest()
+        return paths, key
+
+    def merged_jar_current(self):
+        recorded = self.install_state.get("merged_jar")
+        try:
+            return (recorded is not None and recorded["inputs"] == self.merged_jar_inputs()[1]
+                    and os.path.getsize(self.layout.merged_jar) == recorded["size"])
+        except OSError:
+            return False
+
+    # === Merge the libraries into one deduplicated launch jar ===
+    def build_merged_jar(self):
+        layout = self.layout
+        paths, key = self.merged_jar_inputs()
+        say("merge_jars_building", jars=len(paths), path=layout.merged_jar)
+        try:
+            with trace.phase("merge"):
+                entries, dropped = merge_jars([os.path.join(layout.libraries_folder, *path.split("/")) for path in paths],
+                                              layout.merged_jar)
+        except Exception as e:
+            say("merge_jars_error", error=e)
+            return False
+        self.install_state["merged_jar"] = {"inputs": key, "size": os.path.getsize(layout.merged_jar)}
+        self.save_install_state()
+        say("merge_jars_done", entries=entries, dropped=dropped)
+        return True
+
+    # === Objects this installation uses from the shared store: every verified file plus the native jars ===
+    def store_refs(self):
+        refs = {entry["sha1"] for entry in self.manifest.entries.values()}
+        refs.update(job["sha1"] for job in self.native_jobs if job["sha1"])
+        return refs
+
+    # === Add the verified files to the shared store and link the duplicates to it ===
+    def sync_store(self):
+        store = self.store
+        counts = {"added": 0, "linked": 0}
+        for key, entry in list(self.manifest.entries.items()):
+            file_path = os.path.join(self.layout.minecraft_dir, *key.split("/"))
+            if not self.manifest.matches(file_path, entry["sha1"]):
+                continue
+            result = store.adopt(file_path, entry["sha1"])
+            if result:
+                counts[result] += 1
+            if result == "linked":
+                self.manifest.record(file_path, entry["sha1"])
+        self.manifest.save()
+        store.save()
+        store.write_refs(self.layout.minecraft_dir, self.store_refs())
+        say("store_synced", path=store.root, added=counts["added"], linked=counts["linked"])
+
+    # === Plan the work needed to bring minecraft/ in line with a1.1.1.json ===
+    def plan(self):
+        layout = self.layout
+        plan = []
+
+        for job in self.library_jobs:
+            job["action"] = None
+            if job["sha1"] and self.manifest.matches(job["local_path"], job["sha1"]):
+                continue
+            job["action"] = "verify" if os.path.exists(job["local_path"]) else "download"
+            plan.append((job["action"], "libraries", job["path"]))
+
+        extracted_natives = self.install_state.get("natives", {})
+        for job in self.native_jobs:
+            job["action"] = None
+            recorded = extracted_natives.get(job["cache_key"])
+            if recorded is not None and files_present(job["target_folder"], recorded, self.manifest.full_verify):
+                continue
+            job["action"] = "extract"
+            plan.append(("download", "natives", job["path"]))
+            plan.append(("extract", "natives", job["path"]))
+
+        for leftover in (layout.temp_natives_folder, os.path.join(layout.natives_folder, "META-INF")):
+            if os.path.exists(leftover):
+                plan.append(("remove", "natives", leftover))
+
+        if self.asset_mode == "index":
+            asset_index = self.version_data["assetIndex"]
+            index_path = assets.asset_index_paths(self)[0]
+            if not self.manifest.matches(index_path, asset_index["sha1"]):
+                plan.append(("download", "assets", f"{asset_index['id']} asset index"))
+                plan.append(("sync", "assets", "objects listed in the asset index"))
+            else:
+                stale_objects, stale_links, virtual_folder = assets.plan_index_assets(self)
+                if stale_objects:
+                    plan.append(("download", "assets", f"{stale_objects} asset objects"))
+                if stale_links:
+                    plan.append(("link", "assets", f"{stale_links} files in {virtual_folder}"))
+        elif self.asset_mode == "auto" and os.path.isdir(self.local_assets_folder):
+            pending, _ = assets.plan_local_assets(self.local_assets_folder, layout.virtual_assets_folder)
+            if pending:
+                plan.append(("link", "assets", f"{len(pending)} files from {self.local_assets_folder}"))
+        else:
+            recorded = self.install_state.get("assets_archive")
+            if not (recorded and recorded["url"] == assets.ASSETS_ZIP_URL
+                    and files_present(layout.virtual_assets_folder, recorded["files"], self.manifest.full_verify)):
+                plan.append(("download", "assets", assets.ASSETS_ZIP_URL))
+                plan.append(("extract", "assets", layout.virtual_assets_folder))
+
+        if os.path.exists(os.path.join(layout.minecraft_dir, "a1.1.1.jar")):
+            plan.append(("move", "jar", "a1.1.1.jar"))
+
+        if self.store is not None and self.store.refs(layout.minecraft_dir) != self.store_refs():
+            plan.append(("link", "store", self.store.root))
+
+        if self.merge_jars and not self.merged_jar_current():
+            plan.append(("merge", "launcher", layout.merged_jar))
+
+        if self.java_bin() and not self.cds_current():
+            plan.append(("generate", "launcher", layout.cds_archive))
+
+        try:
+            with open(layout.start_bat, "r", encoding="utf-8") as f:
+                bat_current = f.read() == self.start_bat()
+        except OSError:
+            bat_current = False
+        if not bat_current or load_json(layout.launch_manifest_path) != self.launch_manifest():
+            plan.append(("regenerate", "launcher", layout.start_bat))
+
+        return plan
+
+    # === Print the install plan ===
+    @staticmethod
+    def print_plan(plan):
+        for action, phase, target in plan:
+            print(f"   {action:<10} {phase:<9} {target}")
+        print()
+
+    # === Hash the files the manifest no longer vouches for, without downloading anything ===
+    def verify(self):
+        plan = self.plan()
+        for job in self.library_jobs:
+            if job["action"] == "verify" and self.manifest.is_verified(job["local_path"], job["sha1"]):
+                job["action"] = None
+                plan.remove(("verify", "libraries", job["path"]))
+        if os.path.isdir(self.layout.minecraft_dir):
+            self.manifest.save()
+        return plan
+
+    # === Execute the planned actions (returns 1 when a download, extraction or the assets failed) ===
+    def execute(self, plan):
+        layout = self.layout
+        layout.create()
+        planned_phases = {phase for _, phase, _ in plan}
+        failures = 0
+
+        # Leaving the shared store drops this installation's references; its files stay in place
+        if self.install_state.get("store") != self.store_folder:
+            if self.install_state.get("store"):
+                Store(self.install_state["store"]).drop_refs(layout.minecraft_dir)
+            self.install_state["store"] = self.store_folder
+            self.save_install_state()
+
+        # Download libraries
+        if "libraries" in planned_phases:
+            with trace.phase("libraries"):
+                say("libraries_downloading")
+                jobs = [job for job in self.library_jobs if job["action"]]
+                failures += len(jobs) - len(self.downloader.download_all(jobs))
+
+        # Download and extract native libraries
+        if "natives" in planned_phases:
+            with trace.phase("natives"):
+                say("natives_downloading")
+                if any(job["arch"] for job in self.native_jobs if job["action"]):
+                    say("natives_arch", arch=self.java_arch(), system=host_os(), java=self.java_bin())
+
+                # Records of jars or architectures no longer in use are dropped
+                extracted_natives = self.install_state.setdefault("natives", {})
+                for key in set(extracted_natives) - {job["cache_key"] for job in self.native_jobs}:
+                    del extracted_natives[key]
+
+                # Native jars are extracted straight from the in-memory buffer and never written to disk
+                jobs = [job for job in self.native_jobs if job["action"]]
+                ready = self.downloader.download_all(jobs)
+                failures += len(jobs) - len(ready)
+                for job in ready:
+                    path = job["path"]
+                    try:
+                        say("extracting", path=path, target=job["target_folder"])
+                        with job["data"] as data:
+                            # start.bat may be run with another Java, so Windows keeps twins left by a full extraction
+                            extracted, skipped, members = extract_zip(data, job["target_folder"], job["exclude"],
+                                                                      job["arch"], BAT_NATIVES, remove_unwanted=host_os() != "windows")
+                        say("extracted", path=path, extracted=extracted, skipped=skipped)
+                        extracted_natives[job["cache_key"]] = members
+                        self.save_install_state()
+                    except Exception as e:
+                        say("extract_error", path=path, error=e)
+                        failures += 1
+
+        # Clean temp folder and META-INF left over from older versions of this script
+        if os.path.exists(layout.temp_natives_folder):
+            shutil.rmtree(layout.temp_natives_folder)
+            self.manifest.forget_folder(layout.temp_natives_folder)
+            self.manifest.save()
+            say("deleted_temp_folder", path=layout.temp_natives_folder)
+
+        meta_inf_folder = os.path.join(layout.natives_folder, "META-INF")
+        if os.path.exists(meta_inf_folder):
+            shutil.rmtree(meta_inf_folder)
+            say("deleted_folder", path=meta_inf_folder)
+
+        # Download assets
+        if "assets" in planned_phases:
+            with trace.phase("assets"):
+                if self.asset_mode == "index":
+                    failures += assets.sync_assets_from_index(self)
+                elif self.asset_mode == "auto" and os.path.isdir(self.local_assets_folder):
+                    say("assets_local_copying")
+                    assets.populate_assets_from_local_source(self.local_assets_folder, layout.virtual_assets_folder)
+                else:
+                    if os.path.isdir(self.local_assets_folder):
+                        assets.populate_assets_from_local_source(self.local_assets_folder, layout.virtual_assets_folder)
+                    if not assets.download_assets(self):
+                        failures += 1
+
+        # Move JAR file to main directory if it's in minecraft folder
+        jar_in_minecraft = os.path.join(layout.minecraft_dir, "a1.1.1.jar")
+        if os.path.exists(jar_in_minecraft):
+            shutil.move(jar_in_minecraft, layout.game_jar)
+            say("jar_moved", path=layout.game_jar)
+
+        # Refresh this installation's references even when only downloads were planned
+        if self.store is not None:
+            with trace.phase("store"):
+                self.sync_store()
+
+        # Generate start.bat
+        if "launcher" in planned_phases:
+            with trace.phase("launcher"):
+                if (self.install_state.get("merge_jars", False), self.install_state.get("profile")) != (self.merge_jars, self.profile):
+                    self.install_state["merge_jars"] = self.merge_jars
+                    self.install_state["profile"] = self.profile
+                    self.save_install_state()
+
+                # Without a valid merged jar this run falls back to the separate library jars
+                if self.merge_jars and not self.merged_jar_current() and not self.build_merged_jar():
+                    self.merge_jars = False
+
+                if self.java_bin() and not self.cds_current():
+                    self.build_cds_archive()
+
+                say("bat_generating")
+
+                if not self.java_bin():
+                    say("bat_without_java")
+
+                with open(layout.start_bat, "w", encoding="utf-8") as f:
+                    f.write(self.start_bat())
+
+                say("bat_generated")
+
+                save_json(layout.launch_manifest_path, self.launch_manifest())
+                say("launch_manifest_written", path=layout.launch_manifest_path)
+
+        self.downloader.print_summary()
+        if failures:
+            say("install_failed", count=failures)
+            return 1
+        say("install_done")
+        return 0
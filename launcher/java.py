@@ -0,0 +1,148 @@
+import os
+import re
+import platform
+import shutil
+import string
+
+from launcher.i18n import say
+from launcher.state import load_json, save_json
+
+# === Function to list the folders JVMs are installed into on this platform ===
+def java_roots():
+    if platform.system() == "Windows":
+        install_dirs = [
+            "Program Files\\Java",
+            "Program Files (x86)\\Java",
+            "Program Files\\AdoptOpenJDK",
+            "Program Files (x86)\\AdoptOpenJDK",
+            "Program Files\\Eclipse Adoptium",
+            "Program Files\\Zulu",
+        ]
+        roots = [os.path.join(f"{drive_letter}:\\", path) for drive_letter in string.ascii_uppercase
+                 if os.path.exists(f"{drive_letter}:\\") for path in install_dirs]
+    elif platform.system() == "Darwin":
+        roots = ["/Library/Java/JavaVirtualMachines", os.path.expanduser("~/Library/Java/JavaVirtualMachines")]
+    else:
+        roots = ["/usr/lib/jvm", "/usr/lib64/jvm", "/usr/java", "/opt/java", "/opt"]
+    return roots
+
+# === Function to list the JVM install roots for this platform ===
+def list_java_homes():
+    homes = []
+    java_home = os.environ.get("JAVA_HOME")
+    if java_home:
+        homes.append(java_home)
+
+    for root in java_roots():
+        try:
+            entries = sorted(os.listdir(root), reverse=True)
+        except OSError:
+            continue
+        for entry in entries:
+            home = os.path.join(root, entry)
+            if platform.system() == "Darwin":
+                home = os.path.join(home, "Contents", "Home")
+            homes.append(home)
+
+    # A java found on PATH lives in <home>/bin/java
+    java_on_path = shutil.which("java")
+    if java_on_path:
+        homes.append(os.path.dirname(os.path.dirname(os.path.realpath(java_on_path))))
+    return homes
+
+# === Function to read the release file of a Java home (a JDK 8 keeps it one level above the bundled jre/) ===
+def read_release(java_home):
+    for release_path in (os.path.join(java_home, "release"), os.path.join(os.path.dirname(java_home), "release")):
+        try:
+            with open(release_path, "r") as f:
+                return {key: value.strip().strip('"') for key, value in (line.split("=", 1) for line in f if "=" in line)}
+        except OSError:
+            continue
+    return {}
+
+# === Function to read the Java version from the release file, spawning the JVM only as a fallback ===
+def read_java_version(java_home, java_bin):
+    version = read_release(java_home).get("JAVA_VERSION")
+    if version:
+        return version
+
+    import subprocess
+    try:
+        return subprocess.check_output([java_bin, "-version"], stderr=subprocess.STDOUT, text=True)
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+# === Function to get the pointer size of a JVM ("32" or "64"), None when it cannot be told ===
+# The JVM loads the natives, so its architecture counts, not the one of the Python running this script
+def java_arch(java_bin):
+    os_arch = read_release(os.path.dirname(os.path.dirname(os.path.realpath(java_bin)))).get("OS_ARCH")
+    if os_arch:
+        return "64" if "64" in os_arch or os_arch == "sparcv9" else "32"
+
+    import subprocess
+    try:
+        output = subprocess.run([java_bin, "-XshowSettings:properties", "-version"], stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, text=True, timeout=60).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    match = re.search(r"sun\.arch\.data\.model = (32|64)", output)
+    return match.group(1) if match else None
+
+# === Function to fingerprint everything the search looks at: JAVA_HOME, PATH and the install and PATH folders ===
+def search_fingerprint():
+    folders = java_roots() + os.environ.get("PATH", "").split(os.pathsep)
+    if os.environ.get("JAVA_HOME"):
+        folders.append(os.environ["JAVA_HOME"])
+    mtimes = {}
+    for folder in folders:
+        try:
+            mtimes[folder] = os.stat(folder).st_mtime_ns
+        except OSError:
+            mtimes[folder] = None
+    return {"java_home_env": os.environ.get("JAVA_HOME"), "path_env": os.environ.get("PATH"), "folders": mtimes}
+
+# === Function to find Java 8 (save_cache=False leaves java.json untouched, e.g. for --dry-run) ===
+def find_java_8(cache_path, save_cache=True):
+    java_exe = "java.exe" if platform.system() == "Windows" else "java"
+
+    # Reuse the previous result while the java binary and JAVA_HOME are unchanged
+    cached = load_json(cache_path)
+    try:
+        if cached.get("path") and (cached.get("java_home_env") == os.environ.get("JAVA_HOME")
+                                   and os.stat(cached["path"]).st_mtime_ns == cached["mtime_ns"]):
+            say("java_found_cached", path=cached["path"])
+            return cached["path"]
+    except (OSError, KeyError):
+        pass
+
+    # A failed search is only repeated once something it looked at has changed
+    fingerprint = search_fingerprint()
+    if "path" in cached and cached["path"] is None and cached.get("search") == fingerprint:
+        say("java_not_found_cached")
+        return None
+
+    checked = set()
+    for java_home in list_java_homes():
+        java_bin = os.path.join(java_home, "bin", java_exe)
+        if java_bin in checked or not os.path.isfile(java_bin):
+            continue
+        checked.add(java_bin)
+
+        version = read_java_version(java_home, java_bin)
+        if version and ("1.8" in version or "8u" in version):
+            say("java_found", path=java_bin)
+            if save_cache:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                save_json(cache_path, {
+                    "path": java_bin,
+                    "version": version.strip(),
+                    "mtime_ns": os.stat(java_bin).st_mtime_ns,
+                    "java_home_env": os.environ.get("JAVA_HOME"),
+                })
+            return java_bin
+
+    say("java_not_found")
+    if save_cache:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        save_json(cache_path, {"path": None, "search": fingerprint})
+    return None
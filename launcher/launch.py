@@ -0,0 +1,181 @@
+import os
+import sys
+import json
+import platform
+
+from launcher.i18n import say, text
+from launcher.java import find_java_8
+from launcher.layout import host_os
+
+# === Placeholder values for minecraftArguments ===
+ARGUMENT_VALUES = {
+    "${auth_player_name}": "Paffcio",
+    "${auth_session}": "token",
+    "${game_directory}": "minecraft",
+    "${game_assets}": "minecraft/assets",
+}
+
+# === Native libraries start.bat names explicitly (kept whatever the architecture) ===
+BAT_NATIVES = ["OpenAL32.dll"]
+
+# === Libraries that must come first on the classpath ===
+CLASSPATH_FIRST = ["org.lwjgl.lwjgl:lwjgl:2.9.3-grayscreenfix"]
+
+# === JVM launch profiles for Java 8 (launcher.json can add more under "profiles") ===
+JVM_PROFILES = {
+    "default": [],
+    "low-memory": ["-Xms64m", "-Xmx256m", "-XX:+UseSerialGC", "-XX:MaxMetaspaceSize=128m"],
+    "throughput": ["-Xms1g", "-Xmx1g", "-XX:+UseParallelGC"],
+    "fast-start": ["-Xms256m", "-Xmx512m", "-XX:+UseSerialGC", "-XX:TieredStopAtLevel=1"],
+}
+
+# === Function to list the built-in profiles together with the ones from launcher.json ===
+def load_profiles(config):
+    profiles = dict(JVM_PROFILES)
+    profiles.update(config.get("profiles", {}))
+    return profiles
+
+# === Function to get the flags that make the JVM use a class-data-sharing archive ===
+def cds_arguments(archive_path, share="auto"):
+    # -Xshare:auto silently falls back when the archive does not match the JVM; -Xshare:on fails instead
+    return ["-XX:+UnlockDiagnosticVMOptions", f"-XX:SharedArchiveFile={archive_path}", f"-Xshare:{share}"]
+
+# === Function to fill in the game arguments (argument_values overrides the defaults, e.g. the player name) ===
+def build_game_arguments(version_data, argument_values=None):
+    arguments = version_data["minecraftArguments"]
+    for placeholder, value in dict(ARGUMENT_VALUES, **(argument_values or {})).items():
+        arguments = arguments.replace(placeholder, value)
+    return arguments
+
+# === Function to resolve the library classpath from a1.1.1.json in a fixed order ===
+def build_library_classpath(version_data):
+    libraries = [lib for lib in version_data["libraries"] if "artifact" in lib.get("downloads", {})]
+    libraries.sort(key=lambda lib: lib["name"] not in CLASSPATH_FIRST)
+    return [lib["downloads"]["artifact"].get("path", lib["downloads"]["artifact"]["url"].split("/")[-1])
+            for lib in libraries]
+
+# === Function to build the launch manifest (paths relative to the main directory) ===
+def build_launch_manifest(version_data, layout, native_os_list, merged_jar=False, jvm_arguments=(), argument_values=None):
+    def relative(path):
+        return os.path.relpath(path, layout.main_dir).replace(os.sep, "/")
+
+    if merged_jar:
+        classpath = [relative(layout.merged_jar)]
+    else:
+        classpath = [relative(os.path.join(layout.libraries_folder, *path.split("/")))
+                     for path in build_library_classpath(version_data)]
+    classpath.append(relative(layout.game_jar))
+    return {
+        "main_class": version_data["mainClass"],
+        "jvm_arguments": list(jvm_arguments),
+        "classpath": classpath,
+        "game_arguments": build_game_arguments(version_data, argument_values).split(),
+        "natives": {os_name: relative(layout.natives_folder_for(os_name)) for os_name in native_os_list},
+    }
+
+# === Function to generate the contents of start.bat ===
+def build_start_bat(version_data, java_bin, merged_jar=False, jvm_arguments=(), argument_values=None):
+    if not java_bin:
+        java_cmd = "java"
+    else:
+        java_cmd = f'"{java_bin}"'
+
+    if merged_jar:
+        library_classpath = "minecraft\\libraries-merged.jar"
+    else:
+        library_classpath = ";".join("%LIB_DIR%\\" + path.replace("/", "\\") for path in build_library_classpath(version_data))
+
+    bat_content = f"""@echo off
+setlocal
+
+{text("bat_game_filename")}
+set MC_JAR=a1.1.1.jar
+
+{text("bat_main_class")}
+set MAIN_CLASS={version_data["mainClass"]}
+
+{text("bat_arguments")}
+set MC_ARGS={build_game_arguments(version_data, argument_values)}
+
+{text("bat_jvm_arguments")}
+set JVM_ARGS={" ".join(jvm_arguments)}
+
+{text("bat_library_dir")}
+set LIB_DIR=minecraft\\libraries
+
+{text("bat_natives_dir")}
+set NATIVE_LIB_DIR=minecraft\\natives
+
+{text("bat_assets_dir")}
+if not exist minecraft\\assets mkdir minecraft\\assets
+
+{text("bat_classpath")}
+set CLASSPATH={library_classpath}
+
+{text("bat_game_jar_last")}
+set CLASSPATH=%CLASSPATH%;%MC_JAR%
+
+{text("bat_launch")}
+{text("bat_launching")}
+{java_cmd} %JVM_ARGS% -Djava.library.path="%NATIVE_LIB_DIR%" -Dorg.lwjgl.opengl.Display.allowSoftwareOpenGL=true -Dorg.lwjgl.openal.libname="%NATIVE_LIB_DIR%\\OpenAL32.dll" -cp "%CLASSPATH%" %MAIN_CLASS% %MC_ARGS% >> log.log 2>&1
+
+endlocal
+"""
+    return bat_content
+
+# === Function to start the game: supervised from the launch manifest, or start.bat / exec when supervise is off ===
+def launch(layout, supervise=True):
+    if platform.system() == "Windows" and not supervise:
+        if not os.path.exists(layout.start_bat):
+            say("launch_missing_bat")
+            return 1
+        import subprocess
+        return subprocess.call(["cmd", "/c", layout.start_bat], cwd=layout.main_dir)
+
+    try:
+        with open(layout.launch_manifest_path, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        say("launch_missing_manifest", path=layout.launch_manifest_path)
+        return 1
+
+    natives = manifest["natives"].get(host_os())
+    if natives is None:
+        say("launch_unsupported_os", system=platform.system())
+        return 1
+
+    natives_folder = os.path.join(layout.main_dir, natives)
+    java_bin = find_java_8(layout.java_cache_path) or "java"
+    system_properties = [
+        f"-Djava.library.path={natives_folder}",
+        "-Dorg.lwjgl.opengl.Display.allowSoftwareOpenGL=true",
+    ]
+    if host_os() == "windows":
+        system_properties.append(f"-Dorg.lwjgl.openal.libname={os.path.join(natives_folder, 'OpenAL32.dll')}")
+    if supervise:
+        # LWJGL's debug output marks the moment the display comes up
+        system_properties.append("-Dorg.lwjgl.util.Debug=true")
+    command = [java_bin] + manifest.get("jvm_arguments", []) + system_properties + [
+        "-cp", os.pathsep.join(os.path.join(layout.main_dir, path) for path in manifest["classpath"]),
+        manifest["main_class"],
+    ] + manifest["game_arguments"]
+
+    # The game arguments use paths relative to the main directory
+    say("launch_starting", java=java_bin)
+    if supervise:
+        from launcher.state import load_json
+        from launcher.supervisor import supervise as supervise_game
+        profile = load_json(layout.install_state_path).get("profile", "default")
+        try:
+            return supervise_game(layout, command, profile, manifest.get("jvm_arguments", []))
+        except OSError:
+            say("java_not_found")
+            return 1
+
+    sys.stdout.flush()
+    os.chdir(layout.main_dir)
+    try:
+        os.execvp(java_bin, command)
+    except OSError:
+        say("java_not_found")
+        return 1
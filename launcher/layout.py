@@ -0,0 +1,66 @@
+import os
+import sys
+import platform
+
+# === a1.1.1.json names the operating systems windows, linux and osx ===
+NATIVE_OS = {"Windows": "windows", "Linux": "linux", "Darwin": "osx"}
+
+# === Function to get the a1.1.1.json name of this operating system ===
+def host_os():
+    return NATIVE_OS.get(platform.system())
+
+# === Function to get the pointer size of this Python ("32" or "64"), the fallback for ${arch} in a1.1.1.json without a JVM ===
+def host_arch():
+    return "64" if sys.maxsize > 2**32 else "32"
+
+# === Function to get the per-user cache folder shared by every installation (XDG_CACHE_HOME, or LOCALAPPDATA on Windows) ===
+def user_cache_folder():
+    if os.name == "nt":
+        cache_folder = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+    else:
+        cache_folder = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_folder, "minecraft-a1.1.1")
+
+# === Directory layout of one installation ===
+class Layout:
+    def __init__(self, main_dir, minecraft_dir=None):
+        self.main_dir = main_dir  # Folder containing run-EN.py / run-PL.py
+        self.json_path = os.path.join(main_dir, "a1.1.1.json")
+        self.minecraft_dir = minecraft_dir or os.path.join(main_dir, "minecraft")
+
+        # Target directories
+        self.libraries_folder = os.path.join(self.minecraft_dir, "libraries")
+        self.natives_folder = os.path.join(self.minecraft_dir, "natives")
+        self.temp_natives_folder = os.path.join(self.natives_folder, "temp")
+        self.assets_folder = os.path.join(self.minecraft_dir, "assets")
+        self.virtual_assets_folder = os.path.join(self.assets_folder, "virtual", "legacy")
+
+        # State files
+        self.manifest_path = os.path.join(self.minecraft_dir, "verified.json")
+        self.install_state_path = os.path.join(self.minecraft_dir, "install.json")
+        self.java_cache_path = os.path.join(self.minecraft_dir, "java.json")
+        self.launch_manifest_path = os.path.join(self.minecraft_dir, "launch.json")
+        self.launch_history_path = os.path.join(self.minecraft_dir, "launches.jsonl")
+
+        # Game jar and launcher script
+        self.game_jar = os.path.join(main_dir, "a1.1.1.jar")
+        self.merged_jar = os.path.join(self.minecraft_dir, "libraries-merged.jar")
+        self.cds_archive = os.path.join(self.minecraft_dir, "a1.1.1.jsa")
+
+        # Optional user settings (launch profile and custom profiles)
+        self.config_path = os.path.join(main_dir, "launcher.json")
+        self.start_bat = os.path.join(main_dir, "start.bat")
+        self.game_log = os.path.join(main_dir, "logs", "game.log")
+
+    # === Native library folder for one operating system (start.bat uses the Windows one) ===
+    def natives_folder_for(self, os_name):
+        if os_name == "windows":
+            return self.natives_folder
+        return os.path.join(self.minecraft_dir, f"natives-{os_name}")
+
+    # === Create directories if they don't exist ===
+    def create(self):
+        os.makedirs(self.minecraft_dir, exist_ok=True)
+        os.makedirs(self.libraries_folder, exist_ok=True)
+        os.makedirs(self.natives_folder, exist_ok=True)
+        os.makedirs(self.assets_folder, exist_ok=True)
@@ -0,0 +1,76 @@
+import os
+import time
+import threading
+from urllib.parse import urlsplit
+
+from launcher import trace
+from launcher.i18n import say
+
+# === Function to tell a local mirror directory from an HTTP mirror ===
+def is_local_mirror(mirror):
+    return not mirror.startswith(("http://", "https://"))
+
+# === Function to get the folder of a local mirror (a plain path or a file:// URL) ===
+def local_folder(mirror):
+    return mirror[len("file://"):] if mirror.startswith("file://") else mirror
+
+# === Function to map an upstream URL onto a mirror laid out as <mirror>/<host>/<path> (what wget -x creates) ===
+def mirror_location(mirror, url):
+    parts = urlsplit(url)
+    relative_path = parts.hostname + parts.path
+    if is_local_mirror(mirror):
+        return os.path.join(local_folder(mirror), *relative_path.split("/"))
+    return mirror.rstrip("/") + "/" + relative_path
+
+# === Ordered mirror list: probed once, fastest healthy mirror first, upstream always last ===
+class MirrorList:
+    def __init__(self, mirrors):
+        self.mirrors = list(dict.fromkeys(mirrors))
+        self.lock = threading.Lock()
+        self.probed = False
+        self.down = set()
+
+    def __bool__(self):
+        return bool(self.mirrors)
+
+    # Measure the round trip to every mirror; unreachable mirrors are skipped for this run
+    def probe(self, session_factory):
+        with self.lock:
+            if self.probed:
+                return
+            latencies = {}
+            session = None
+            for mirror in self.mirrors:
+                if not is_local_mirror(mirror) and session is None:
+                    session = session_factory()
+                start = time.perf_counter()
+                if is_local_mirror(mirror):
+                    healthy = os.path.isdir(local_folder(mirror))
+                else:
+                    try:
+                        healthy = session.head(mirror, timeout=5, allow_redirects=True).status_code < 500
+                    except Exception:
+                        healthy = False
+                latency = time.perf_counter() - start
+                trace.event("mirror_probe", mirror=mirror, healthy=healthy, seconds=round(latency, 6))
+                if healthy:
+                    latencies[mirror] = latency
+                else:
+                    self.down.add(mirror)
+                    say("mirror_down", mirror=mirror)
+
+            # sorted() is stable, so mirrors with equal latency keep their configured order
+            self.mirrors = sorted(latencies, key=latencies.get)
+            if self.mirrors:
+                say("mirror_order", mirrors=", ".join(f"{mirror} ({latencies[mirror] * 1000:.0f} ms)" for mirror in self.mirrors))
+            self.probed = True
+
+    # Sources to try for one URL, as (mirror, location) pairs; mirror None is the upstream URL itself
+    def candidates(self, url):
+        with self.lock:
+            mirrors = [mirror for mirror in self.mirrors if mirror not in self.down]
+        return [(mirror, mirror_location(mirror, url)) for mirror in mirrors] + [(None, url)]
+
+    def mark_down(self, mirror):
+        with self.lock:
+            self.down.add(mirror)
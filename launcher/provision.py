@@ -0,0 +1,113 @@
+import os
+import re
+import shutil
+
+from launcher import trace
+from launcher.files import link_or_copy
+from launcher.i18n import say
+from launcher.launch import build_launch_manifest, build_start_bat
+from launcher.layout import Layout
+from launcher.state import save_json
+
+# === Player names Minecraft accepts (they also end up unquoted in start.bat) ===
+PLAYER_NAME = re.compile(r"^[A-Za-z0-9_]{1,16}$")
+
+# === Function to expand the player name pattern into one name per instance (None when it is unusable) ===
+def player_names(pattern, count):
+    try:
+        names = [pattern.format(n=n) for n in range(1, count + 1)]
+    except (KeyError, IndexError, ValueError):
+        return None
+    if not names or len(set(names)) != len(names) or not all(PLAYER_NAME.match(name) for name in names):
+        return None
+    return names
+
+# === Function to link one file into an instance unless it already shares the same data ===
+def link_into(source_path, target_path):
+    if os.path.exists(target_path) and os.path.samefile(source_path, target_path):
+        return 0
+    link_or_copy(source_path, target_path)
+    return 1
+
+# === Set up one instance from the base installation: links, state files and its own launcher script ===
+def provision_instance(installer, instance_dir, player, jvm_arguments):
+    base = installer.layout
+    layout = Layout(instance_dir)
+    layout.create()
+
+    # Everything the installer manages is linked; saves, options and logs stay per instance
+    folders = [base.libraries_folder, base.assets_folder] + [base.natives_folder_for(os_name) for os_name in installer.native_os_list]
+    linked = 0
+    for folder in folders:
+        for root, _, files in os.walk(folder):
+            for name in files:
+                if name.endswith((".part", ".part.json", ".tmp")):
+                    continue
+                source_path = os.path.join(root, name)
+                linked += link_into(source_path, os.path.join(layout.minecraft_dir, os.path.relpath(source_path, base.minecraft_dir)))
+
+    files = [(base.game_jar, layout.game_jar), (base.cds_archive, layout.cds_archive)]
+    if installer.merge_jars:
+        files.append((base.merged_jar, layout.merged_jar))
+    for source_path, target_path in files:
+        if os.path.exists(source_path):
+            linked += link_into(source_path, target_path)
+
+    # Hardlinks keep size, mtime and inode, so the base verification manifest holds for the instance too
+    save_json(layout.manifest_path, installer.manifest.entries)
+    save_json(layout.install_state_path, dict(installer.install_state, player=player))
+    if os.path.exists(base.java_cache_path):
+        shutil.copy2(base.java_cache_path, layout.java_cache_path)
+
+    argument_values = {"${auth_player_name}": player}
+    with open(layout.start_bat, "w", encoding="utf-8") as f:
+        f.write(build_start_bat(installer.version_data, installer.java_bin(), installer.merge_jars, jvm_arguments, argument_values))
+    save_json(layout.launch_manifest_path, build_launch_manifest(installer.version_data, layout, installer.native_os_list,
+                                                                 installer.merge_jars, jvm_arguments, argument_values))
+
+    if installer.store is not None:
+        installer.store.write_refs(layout.minecraft_dir, installer.store_refs())
+    return linked
+
+# === provision: install once, then fan the result out to N isolated game directories ===
+def provision(installer, count, instances_folder, player_pattern):
+    from concurrent.futures import ThreadPoolExecutor
+
+    names = player_names(player_pattern, count)
+    if names is None:
+        say("provision_bad_names", pattern=player_pattern, count=count)
+        return 1
+
+    # All network, hashing and extraction work happens once, in the base installation
+    with trace.phase("plan"):
+        plan = installer.plan()
+    if plan:
+        say("plan_header")
+        installer.print_plan(plan)
+        # Instances would only share the broken files, so a failed install stops here
+        if installer.execute(plan):
+            return 1
+
+    # Looked up once here so the worker threads share the same values
+    installer.java_bin()
+    jvm_arguments = installer.jvm_arguments()
+
+    say("provision_start", count=count, path=instances_folder)
+    failed = 0
+    with trace.phase("provision"):
+        with ThreadPoolExecutor(max_workers=installer.downloader.max_workers) as executor:
+            futures = {name: executor.submit(provision_instance, installer, os.path.join(instances_folder, name), name, jvm_arguments)
+                       for name in names}
+            for name, future in futures.items():
+                instance_dir = os.path.join(instances_folder, name)
+                try:
+                    linked = future.result()
+                except Exception as e:
+                    say("provision_error", path=instance_dir, error=e)
+                    failed += 1
+                    continue
+                trace.event("provision", instance=instance_dir, player=name, linked=linked)
+                say("provision_instance_done", player=name, path=instance_dir, linked=linked)
+
+    say("provision_done", count=count - failed, path=instances_folder)
+    return 1 if failed else 0
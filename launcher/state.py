@@ -0,0 +1,129 @@
+import os
+import json
+import time
+import hashlib
+import threading
+
+from launcher import trace
+
+# === Function to compute the SHA1 of a file ===
+def file_sha1(file_path):
+    start = time.perf_counter()
+    sha1 = hashlib.sha1()
+    size = 0
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            sha1.update(chunk)
+            size += len(chunk)
+    trace.hashed(file_path, size, time.perf_counter() - start)
+    return sha1.hexdigest()
+
+# === Function to check SHA1 hash ===
+def check_sha1(file_path, expected_sha1):
+    if not os.path.exists(file_path):
+        return False
+    return file_sha1(file_path) == expected_sha1
+
+# === Function to compute the CRC32 of a file ===
+def file_crc32(file_path):
+    import zlib
+
+    crc = 0
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+# === Functions to read and atomically write small JSON state files ===
+def load_json(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_json(path, data):
+    # A unique temporary name, so processes saving the same file never write into each other's copy
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(temp_path, path)
+
+# === Function to check that every recorded extracted file is still intact ===
+# Records are {"size", "crc", "mtime_ns"} (a plain size in older state files); full_verify checks the CRC32 instead of the mtime
+def files_present(target_folder, files, full_verify=False):
+    for name, recorded in files.items():
+        file_path = os.path.join(target_folder, *name.split("/"))
+        try:
+            if isinstance(recorded, int):
+                if os.path.getsize(file_path) != recorded:
+                    return False
+                continue
+            st = os.stat(file_path)
+            if st.st_size != recorded["size"]:
+                return False
+            if full_verify:
+                if file_crc32(file_path) != recorded["crc"]:
+                    return False
+            elif st.st_mtime_ns != recorded["mtime_ns"]:
+                return False
+        except OSError:
+            return False
+    return True
+
+# === Verification manifest (path, size, mtime, inode and verified SHA1) ===
+class VerifyManifest:
+    def __init__(self, path, root, full_verify=False):
+        self.path = path
+        self.root = root
+        self.full_verify = full_verify
+        self.lock = threading.Lock()
+        self.entries = load_json(path)
+
+    def save(self):
+        with self.lock:
+            save_json(self.path, self.entries)
+
+    def key(self, file_path):
+        return os.path.relpath(file_path, self.root).replace(os.sep, "/")
+
+    def record(self, file_path, sha1):
+        st = os.stat(file_path)
+        with self.lock:
+            self.entries[self.key(file_path)] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "inode": st.st_ino, "sha1": sha1}
+
+    def forget(self, file_path):
+        with self.lock:
+            self.entries.pop(self.key(file_path), None)
+
+    def forget_folder(self, folder):
+        prefix = self.key(folder) + "/"
+        with self.lock:
+            for key in [key for key in self.entries if key.startswith(prefix)]:
+                del self.entries[key]
+
+    # Check whether the manifest still vouches for a file (no hashing)
+    def matches(self, file_path, expected_sha1):
+        if self.full_verify:
+            return False
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return False
+        entry = self.entries.get(self.key(file_path))
+        return bool(entry and entry["sha1"] == expected_sha1 and entry["size"] == st.st_size
+                    and entry["mtime_ns"] == st.st_mtime_ns and entry["inode"] == st.st_ino)
+
+    # Check a file, trusting the manifest when its stat data still matches
+    def is_verified(self, file_path, expected_sha1):
+        if not os.path.exists(file_path):
+            self.forget(file_path)
+            return False
+        if self.matches(file_path, expected_sha1):
+            return True
+
+        if check_sha1(file_path, expected_sha1):
+            self.record(file_path, expected_sha1)
+            return True
+        self.forget(file_path)
+        return False
@@ -0,0 +1,156 @@
+import os
+import shutil
+import hashlib
+
+from launcher.files import file_lock, link_or_copy
+from launcher.i18n import say
+from launcher.layout import user_cache_folder
+from launcher.state import VerifyManifest, load_json, save_json
+
+# === Function to get the default store folder ===
+def default_store_folder():
+    return os.path.join(user_cache_folder(), "store")
+
+# === Function to pick the store folder: command line, then launcher.json, then the last one used ===
+def store_folder(option, config, install_state):
+    if option is not None:
+        choice = option
+    elif "store" in config:
+        choice = config["store"]
+    else:
+        choice = install_state.get("store")
+    if choice is True:
+        return default_store_folder()
+    if not choice:
+        return None
+    return os.path.abspath(os.path.expanduser(choice))
+
+# === Shared content-addressed store: objects/<xx>/<sha1> plus one reference file per installation ===
+class Store:
+    def __init__(self, root):
+        self.root = root
+        self.objects_folder = os.path.join(root, "objects")
+        self.refs_folder = os.path.join(root, "refs")
+        self.manifest = VerifyManifest(os.path.join(root, "verified.json"), root)
+
+    # Installations share this manifest: entries saved meanwhile by other processes are merged in under a lock
+    def save(self):
+        os.makedirs(self.root, exist_ok=True)
+        with file_lock(os.path.join(self.root, "verified.json.lock")):
+            on_disk = load_json(self.manifest.path)
+            with self.manifest.lock:
+                for key, entry in on_disk.items():
+                    if key not in self.manifest.entries and os.path.exists(os.path.join(self.root, *key.split("/"))):
+                        self.manifest.entries[key] = entry
+            self.manifest.save()
+
+    def object_path(self, sha1):
+        return os.path.join(self.objects_folder, sha1[:2], sha1)
+
+    # Check an object, dropping it when it no longer matches its SHA1
+    def has(self, sha1):
+        object_path = self.object_path(sha1)
+        if self.manifest.is_verified(object_path, sha1):
+            return True
+        if os.path.exists(object_path):
+            os.remove(object_path)
+        return False
+
+    # === Link an object into an installation: hardlink, then reflink, then symlink, then a copy ===
+    def link(self, sha1, target_path):
+        if not self.has(sha1):
+            return False
+        link_or_copy(self.object_path(sha1), target_path, symlink=True)
+        return True
+
+    # === Add a verified file to the store, sharing its data with the installation when possible ===
+    def adopt(self, file_path, sha1):
+        object_path = self.object_path(sha1)
+        if self.has(sha1):
+            if not os.path.samefile(object_path, file_path):
+                link_or_copy(object_path, file_path, symlink=True)
+                return "linked"
+            return None
+
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        try:
+            os.link(file_path, object_path)
+        except FileExistsError:
+            pass
+        except OSError:
+            temp_path = f"{object_path}.{os.getpid()}.tmp"
+            shutil.copy2(file_path, temp_path)
+            os.replace(temp_path, object_path)
+        self.manifest.record(object_path, sha1)
+        return "added"
+
+    # === Open an object for reading (native jars are extracted straight from the store) ===
+    def open(self, sha1):
+        if not self.has(sha1):
+            return None
+        return open(self.object_path(sha1), "rb")
+
+    def add_buffer(self, data, sha1):
+        object_path = self.object_path(sha1)
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        temp_path = f"{object_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            shutil.copyfileobj(data, f)
+        data.seek(0)
+        os.replace(temp_path, object_path)
+        self.manifest.record(object_path, sha1)
+
+    # === Reference files: which objects each installation uses ===
+    def refs_path(self, minecraft_dir):
+        instance_id = hashlib.sha1(os.path.realpath(minecraft_dir).encode()).hexdigest()
+        return os.path.join(self.refs_folder, instance_id + ".json")
+
+    def refs(self, minecraft_dir):
+        return set(load_json(self.refs_path(minecraft_dir)).get("objects", []))
+
+    def write_refs(self, minecraft_dir, objects):
+        os.makedirs(self.refs_folder, exist_ok=True)
+        save_json(self.refs_path(minecraft_dir), {"instance": os.path.realpath(minecraft_dir), "objects": sorted(objects)})
+
+    def drop_refs(self, minecraft_dir):
+        if os.path.exists(self.refs_path(minecraft_dir)):
+            os.remove(self.refs_path(minecraft_dir))
+
+    # === Remove objects no installation references any more ===
+    def collect_garbage(self):
+        referenced = set()
+        instances = 0
+        if os.path.isdir(self.refs_folder):
+            for name in sorted(os.listdir(self.refs_folder)):
+                refs_path = os.path.join(self.refs_folder, name)
+                refs = load_json(refs_path)
+                if not os.path.isdir(refs.get("instance", "")):
+                    os.remove(refs_path)
+                    say("store_gc_dropped", path=refs.get("instance", name))
+                    continue
+                referenced.update(refs.get("objects", []))
+                instances += 1
+
+        removed = 0
+        kept = 0
+        freed = 0
+        if os.path.isdir(self.objects_folder):
+            for prefix in os.listdir(self.objects_folder):
+                folder = os.path.join(self.objects_folder, prefix)
+                for name in os.listdir(folder):
+                    object_path = os.path.join(folder, name)
+                    st = os.stat(object_path)
+                    # Leftovers of interrupted writes are never referenced
+                    # A hardlinked object frees nothing when removed, so it stays until its last link is gone
+                    if not name.endswith(".tmp") and (name in referenced or st.st_nlink > 1):
+                        kept += 1
+                        continue
+                    os.remove(object_path)
+                    self.manifest.forget(object_path)
+                    removed += 1
+                    freed += st.st_size
+                if not os.listdir(folder):
+                    os.rmdir(folder)
+        self.save()
+        say("store_gc_done", removed=removed, megabytes=freed / (1024 * 1024), kept=kept, instances=instances)
+        return removed
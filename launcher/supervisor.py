@@ -0,0 +1,158 @@
+import os
+import re
+import json
+import time
+import platform
+import threading
+import subprocess
+from statistics import median
+from collections import deque
+
+from launcher.i18n import say
+
+# === Game log rotation: logs/game.log plus game.log.1 ... game.log.5 ===
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 5
+
+# === First output line that shows LWJGL is up: -Dorg.lwjgl.util.Debug=true prefixes its lines with "[LWJGL]" ===
+# Stack frames such as "at org.lwjgl.opengl.Display.create" never start with it, so a failed start is not counted
+READY_PATTERN = re.compile(r"^\[LWJGL\] ")
+
+# === Output lines that point at the cause of a crash ===
+CRASH_PATTERN = re.compile(r"A fatal error has been detected|Exception in thread|hs_err_pid\d+\.log|OutOfMemoryError")
+
+# === Number of output lines kept in memory for the crash summary ===
+TAIL_LINES = 20
+
+# === Size-rotated log file shared by the stdout and stderr readers ===
+class RotatingLog:
+    def __init__(self, path, max_bytes=LOG_MAX_BYTES, backups=LOG_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.file = open(path, "ab")
+
+    def rotate(self):
+        self.file.close()
+        for number in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{number}"):
+                os.replace(f"{self.path}.{number}", f"{self.path}.{number + 1}")
+        os.replace(self.path, f"{self.path}.1")
+        self.file = open(self.path, "ab")
+
+    def write(self, stream, line):
+        data = f"{time.strftime('%H:%M:%S')} [{stream}] {line}\n".encode("utf-8")
+        with self.lock:
+            if self.file.tell() and self.file.tell() + len(data) > self.max_bytes:
+                self.rotate()
+            self.file.write(data)
+            self.file.flush()
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+# === Run the JVM, copy its output to the rotated log and time how long LWJGL takes to come up ===
+def supervise(layout, command, profile, jvm_arguments):
+    tail = deque(maxlen=TAIL_LINES)
+    state = {"ready_seconds": None, "crash_lines": []}
+    lock = threading.Lock()
+
+    # OSError (e.g. no java binary) goes to the caller before anything is written
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=layout.main_dir, stdin=subprocess.DEVNULL,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    log = RotatingLog(layout.game_log)
+    say("launch_supervised", pid=process.pid, path=layout.game_log)
+
+    # One reader per pipe keeps both drained, so the game never blocks on a full pipe
+    def pump(pipe, stream):
+        for raw in iter(pipe.readline, b""):
+            line = raw.decode("utf-8", "replace").rstrip("\r\n")
+            log.write(stream, line)
+            with lock:
+                tail.append(line)
+                if CRASH_PATTERN.search(line):
+                    state["crash_lines"].append(line)
+                if state["ready_seconds"] is None and READY_PATTERN.search(line):
+                    state["ready_seconds"] = time.perf_counter() - start
+                    say("launch_ready", seconds=state["ready_seconds"])
+        pipe.close()
+
+    readers = [threading.Thread(target=pump, args=(process.stdout, "stdout"), daemon=True),
+               threading.Thread(target=pump, args=(process.stderr, "stderr"), daemon=True)]
+    for reader in readers:
+        reader.start()
+
+    # Ctrl+C reaches the JVM as well; wait for it to shut down instead of leaving it orphaned
+    while True:
+        try:
+            exit_code = process.wait()
+            break
+        except KeyboardInterrupt:
+            continue
+    for reader in readers:
+        reader.join()
+    log.close()
+    seconds = time.perf_counter() - start
+
+    crashed = exit_code != 0
+    record_launch(layout, {
+        "ts": round(time.time(), 6),
+        "host": platform.node(),
+        "system": f"{platform.system()} {platform.machine()}",
+        "java": command[0],
+        "profile": profile,
+        "jvm_arguments": jvm_arguments,
+        "ready_seconds": None if state["ready_seconds"] is None else round(state["ready_seconds"], 6),
+        "seconds": round(seconds, 6),
+        "exit_code": exit_code,
+        "crashed": crashed,
+    })
+
+    if not crashed:
+        say("launch_exited", seconds=seconds)
+        return 0
+    say("launch_crashed", code=exit_code, seconds=seconds, path=layout.game_log)
+    for line in state["crash_lines"][:5] or list(tail):
+        say("launch_crash_line", line=line)
+    if state["ready_seconds"] is None:
+        say("launch_never_ready")
+    return exit_code if exit_code > 0 else 1
+
+# === Append one launch to minecraft/launches.jsonl ===
+def record_launch(layout, entry):
+    os.makedirs(os.path.dirname(layout.launch_history_path), exist_ok=True)
+    with open(layout.launch_history_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+# === launch --stats: start-up latency per host and JVM profile from minecraft/launches.jsonl ===
+def launch_stats(layout):
+    groups = {}
+    try:
+        with open(layout.launch_history_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                groups.setdefault((entry.get("host", "?"), entry.get("profile", "?")), []).append(entry)
+    except OSError:
+        pass
+
+    if not groups:
+        say("launch_stats_empty", path=layout.launch_history_path)
+        return 0
+
+    say("launch_stats_header")
+    for (host, profile), entries in sorted(groups.items()):
+        ready = sorted(entry["ready_seconds"] for entry in entries if entry.get("ready_seconds") is not None)
+        crashes = sum(1 for entry in entries if entry.get("crashed"))
+        if ready:
+            say("launch_stats_row", host=host, profile=profile, launches=len(entries), crashes=crashes,
+                median=median(ready), fastest=ready[0], slowest=ready[-1])
+        else:
+            say("launch_stats_row_no_ready", host=host, profile=profile, launches=len(entries), crashes=crashes)
+    return 0
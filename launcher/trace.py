@@ -0,0 +1,96 @@
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+from launcher.i18n import say
+
+# === Trace state for this run (events go nowhere until configure() opens a trace file) ===
+trace_file = None
+lock = threading.Lock()
+run_id = f"{os.getpid()}-{int(time.time() * 1000)}"
+started = time.perf_counter()
+phases = {}
+counters = {"bytes_downloaded": 0, "bytes_hashed": 0, "files_downloaded": 0, "files_hashed": 0, "files_extracted": 0}
+urls = []
+
+# === Function to start tracing to a JSON-lines file ===
+def configure(trace_path=None):
+    global trace_file
+    if trace_path:
+        trace_file = open(trace_path, "a", encoding="utf-8")
+    event("run_start", pid=os.getpid())
+
+# === Function to write one trace event ===
+def event(kind, **fields):
+    if trace_file is None:
+        return
+    line = json.dumps({"ts": round(time.time(), 6), "run": run_id, "event": kind, **fields})
+    with lock:
+        trace_file.write(line + "\n")
+        trace_file.flush()
+
+# === Function to add to a run counter ===
+def add(counter, amount=1):
+    with lock:
+        counters[counter] += amount
+
+# === Time one phase of the run (phases with the same name add up) ===
+@contextmanager
+def phase(name):
+    event("phase_start", phase=name)
+    with lock:
+        phases.setdefault(name, 0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        with lock:
+            phases[name] += seconds
+        event("phase_end", phase=name, seconds=round(seconds, 6))
+
+# === Record one HTTP transfer: time to response headers and total time ===
+def download(url, status, written, headers_seconds, seconds):
+    with lock:
+        counters["bytes_downloaded"] += written
+        counters["files_downloaded"] += 1
+        urls.append((seconds, url))
+    event("download", url=url, status=status, bytes=written,
+          headers_seconds=round(headers_seconds, 6), seconds=round(seconds, 6))
+
+# === Record one file hashed from disk ===
+def hashed(path, size, seconds):
+    with lock:
+        counters["bytes_hashed"] += size
+        counters["files_hashed"] += 1
+    event("hash", path=path, bytes=size, seconds=round(seconds, 6))
+
+# === Record one file hashed while it was downloaded or copied (the download event already covers it) ===
+def streamed_hash(size):
+    with lock:
+        counters["bytes_hashed"] += size
+        counters["files_hashed"] += 1
+
+# === Function to finish the trace and optionally print where the time went ===
+def finish(summary=False):
+    wall_seconds = time.perf_counter() - started
+    event("run_end", seconds=round(wall_seconds, 6), phases={name: round(seconds, 6) for name, seconds in phases.items()},
+          **counters)
+    if trace_file is not None:
+        trace_file.close()
+    if not summary:
+        return
+
+    say("timings_header", seconds=wall_seconds)
+    for name, seconds in phases.items():
+        print(f"   {name:<12} {seconds:9.3f}s {seconds / wall_seconds * 100:6.1f}%")
+    print()
+    say("timings_counters", downloaded=counters["bytes_downloaded"] / (1024 * 1024), files=counters["files_downloaded"],
+        hashed=counters["bytes_hashed"] / (1024 * 1024), hashed_files=counters["files_hashed"],
+        extracted=counters["files_extracted"])
+    if urls:
+        say("timings_slowest")
+    for seconds, url in sorted(urls, reverse=True)[:5]:
+        print(f"   {seconds:9.3f}s  {url}")